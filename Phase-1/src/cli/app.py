@@ -1,5 +1,7 @@
 """Main application entry point for Todo console app."""
 
+import sys
+
 from src.services.task_manager import TaskManager
 from src.cli.menu import (
     add_task_command,
@@ -13,18 +15,38 @@ from src.cli.menu import (
 )
 
 
+# Menu dispatch table: single dict lookup instead of a 9-way elif chain
+_DISPATCH = {
+    "1": add_task_command,
+    "2": view_tasks_command,
+    "3": update_task_command,
+    "4": delete_task_command,
+    "5": mark_complete_command,
+    "6": mark_incomplete_command,
+    "7": search_tasks_command,
+    "8": filter_tasks_command,
+}
+
+
+# Menu text preformatted once so each render is a single stdout write
+_MENU = (
+    "\n=== Todo Application ===\n"
+    "1. Add Task\n"
+    "2. View All Tasks\n"
+    "3. Update Task\n"
+    "4. Delete Task\n"
+    "5. Mark Task Complete\n"
+    "6. Mark Task Incomplete\n"
+    "7. Search Tasks\n"
+    "8. Filter Tasks\n"
+    "9. Exit\n"
+)
+
+
 def display_menu() -> None:
     """Display the main menu options."""
-    print("\n=== Todo Application ===")
-    print("1. Add Task")
-    print("2. View All Tasks")
-    print("3. Update Task")
-    print("4. Delete Task")
-    print("5. Mark Task Complete")
-    print("6. Mark Task Incomplete")
-    print("7. Search Tasks")
-    print("8. Filter Tasks")
-    print("9. Exit")
+    sys.stdout.write(_MENU)
+    sys.stdout.flush()
 
 
 def display_startup_notifications(manager: TaskManager) -> None:
@@ -33,19 +55,20 @@ def display_startup_notifications(manager: TaskManager) -> None:
     Args:
         manager: TaskManager instance to check for due dates
     """
-    overdue = manager.get_overdue_tasks()
-    due_today = manager.get_tasks_due_today()
-    upcoming = manager.get_upcoming_tasks(days=1)  # Tasks due tomorrow
-
-    if overdue or due_today or upcoming:
-        print("\n⏰ Task Reminders:")
-        if overdue:
-            print(f"  • {len(overdue)} task(s) OVERDUE")
-        if due_today:
-            print(f"  • {len(due_today)} task(s) due TODAY")
-        if upcoming:
-            print(f"  • {len(upcoming)} task(s) due TOMORROW")
-        print()
+    # Single pass over the task store; only counts are needed here
+    overdue_n, today_n, upcoming_n = manager.get_due_buckets(days=1)  # Tasks due tomorrow
+
+    if overdue_n or today_n or upcoming_n:
+        parts = ["\n⏰ Task Reminders:\n"]
+        if overdue_n:
+            parts.append(f"  • {overdue_n} task(s) OVERDUE\n")
+        if today_n:
+            parts.append(f"  • {today_n} task(s) due TODAY\n")
+        if upcoming_n:
+            parts.append(f"  • {upcoming_n} task(s) due TOMORROW\n")
+        parts.append("\n")
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
 
 
 def main() -> None:
@@ -73,22 +96,9 @@ def main() -> None:
         try:
             choice = input("\nEnter choice (1-9): ").strip()
 
-            if choice == "1":
-                add_task_command(manager)
-            elif choice == "2":
-                view_tasks_command(manager)
-            elif choice == "3":
-                update_task_command(manager)
-            elif choice == "4":
-                delete_task_command(manager)
-            elif choice == "5":
-                mark_complete_command(manager)
-            elif choice == "6":
-                mark_incomplete_command(manager)
-            elif choice == "7":
-                search_tasks_command(manager)
-            elif choice == "8":
-                filter_tasks_command(manager)
+            command = _DISPATCH.get(choice)
+            if command is not None:
+                command(manager)
             elif choice == "9":
                 print("\nGoodbye!")
                 break
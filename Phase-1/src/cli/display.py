@@ -1,10 +1,27 @@
 """Display formatting helpers for console output."""
 
 from typing import List
-from datetime import datetime
+from datetime import date, datetime
 from src.models.task import Task
 
 
+# Precomputed display constants (avoid rebuilding color strings per task)
+_STATUS = ("☐", "☑")  # indexed by is_complete
+_PRIORITY_BADGE = {
+    "high": "\033[91m[HIGH]\033[0m",      # Red
+    "medium": "\033[93m[MEDIUM]\033[0m",  # Yellow
+    "low": "\033[94m[LOW]\033[0m",        # Blue
+    None: "",
+}
+_OVERDUE = "\033[91m\033[1mOVERDUE\033[0m"        # Red, bold
+_DUE_TODAY = "\033[93m\033[1mDUE TODAY\033[0m"    # Yellow, bold
+_EMPTY_LIST_RENDERED = (
+    "=== Task List ===\n"
+    "No tasks found. Add a task to get started!\n"
+    "=== End of List ==="
+)
+
+
 def format_status_indicator(is_complete: bool) -> str:
     """Get status indicator symbol.
 
@@ -14,7 +31,7 @@ def format_status_indicator(is_complete: bool) -> str:
     Returns:
         str: "☑" if complete, "☐" if incomplete
     """
-    return "☑" if is_complete else "☐"
+    return _STATUS[is_complete]
 
 
 def format_priority_badge(priority: str) -> str:
@@ -26,26 +43,18 @@ def format_priority_badge(priority: str) -> str:
     Returns:
         str: Colored priority badge or empty string if None
     """
-    if not priority:
-        return ""
-
-    # Color codes: Red for high, Yellow for medium, Blue for low
-    colors = {
-        "high": "\033[91m",    # Red
-        "medium": "\033[93m",  # Yellow
-        "low": "\033[94m"      # Blue
-    }
-    reset = "\033[0m"
-
-    color = colors.get(priority, "")
-    return f"{color}[{priority.upper()}]{reset}"
+    return _PRIORITY_BADGE.get(priority, "")
 
 
-def format_due_date_indicator(due_date: datetime) -> str:
+def format_due_date_indicator(due_date: datetime, today: date = None, cached_str: str = None) -> str:
     """Get colored due date indicator.
 
     Args:
         due_date: Task due date or None
+        today: Today's date (optional, defaults to datetime.now().date();
+            callers rendering many tasks pass it once to avoid per-task clock reads)
+        cached_str: Pre-formatted "YYYY-MM-DD" string for due_date (optional;
+            skips re-formatting on the common future-date path)
 
     Returns:
         str: Colored due date indicator or empty string if None
@@ -58,21 +67,16 @@ def format_due_date_indicator(due_date: datetime) -> str:
     if not due_date:
         return ""
 
-    now = datetime.now()
-    today = now.date()
+    if today is None:
+        today = datetime.now().date()
     task_date = due_date.date()
 
-    # Color codes
-    red_bold = "\033[91m\033[1m"
-    yellow_bold = "\033[93m\033[1m"
-    reset = "\033[0m"
-
     if task_date < today:
-        return f"{red_bold}OVERDUE{reset}"
+        return _OVERDUE
     elif task_date == today:
-        return f"{yellow_bold}DUE TODAY{reset}"
+        return _DUE_TODAY
     else:
-        return f"Due: {task_date.strftime('%Y-%m-%d')}"
+        return f"Due: {cached_str}" if cached_str else f"Due: {task_date:%Y-%m-%d}"
 
 
 def format_task_list(tasks: List[Task]) -> str:
@@ -99,37 +103,42 @@ def format_task_list(tasks: List[Task]) -> str:
         No tasks found. Add a task to get started!
         === End of List ===
     """
+    if not tasks:
+        return _EMPTY_LIST_RENDERED
+
     lines = ["=== Task List ==="]
 
-    if not tasks:
-        lines.append("No tasks found. Add a task to get started!")
-    else:
-        for task in tasks:
-            status = format_status_indicator(task.is_complete)
-            priority_badge = format_priority_badge(task.priority)
-            due_date_indicator = format_due_date_indicator(task.due_date)
-
-            # Build title line with optional priority badge and due date
-            title_parts = [f"[{task.id}]", status]
-            if priority_badge:
-                title_parts.append(priority_badge)
-            title_parts.append(task.title)
-            if due_date_indicator:
-                title_parts.append(due_date_indicator)
-
-            lines.append(" ".join(title_parts))
-
-            # Build metadata line (category, description, and recurrence)
-            metadata_parts = []
-            if task.category:
-                metadata_parts.append(f"Category: {task.category}")
-            if task.description:
-                metadata_parts.append(f"Description: {task.description}")
-            if task.recurrence_rule:
-                metadata_parts.append(f"Recurring: {task.recurrence_rule}")
-
-            if metadata_parts:
-                lines.append(f"    {' | '.join(metadata_parts)}")
+    # Local aliases to skip global lookups in the tight loop
+    append = lines.append
+    _status = _STATUS
+    _badge = _PRIORITY_BADGE
+
+    # One clock read per render instead of one per task
+    today = datetime.now().date()
+
+    for task in tasks:
+        due = format_due_date_indicator(task.due_date, today, task._due_date_str)
+
+        # Title line with optional priority badge and due date indicator
+        badge = _badge[task.priority]
+        append(
+            f"[{task.id}] {_status[task.is_complete]}"
+            f"{' ' + badge if badge else ''} {task.title}"
+            f"{' ' + due if due else ''}"
+        )
+
+        # Metadata line (category, description, and recurrence)
+        metadata = " | ".join(
+            f"{label}: {value}"
+            for label, value in (
+                ("Category", task.category),
+                ("Description", task.description),
+                ("Recurring", task.recurrence_rule),
+            )
+            if value
+        )
+        if metadata:
+            append(f"    {metadata}")
 
     lines.append("=== End of List ===")
     return "\n".join(lines)
@@ -6,6 +6,15 @@ from src.services.task_manager import TaskManager, VALID_PRIORITIES, DEFAULT_CAT
 from src.cli.display import format_task_list
 
 
+# Prompt fragments and membership sets precomputed once at module load
+_PRIORITY_CHOICES = "/".join(VALID_PRIORITIES)
+_PRIORITY_LIST = ", ".join(VALID_PRIORITIES)
+_PRIORITY_SET = frozenset(VALID_PRIORITIES)
+_RECURRENCE_CHOICES = "/".join(VALID_RECURRENCE_RULES)
+_RECURRENCE_LIST = ", ".join(VALID_RECURRENCE_RULES)
+_RECURRENCE_SET = frozenset(VALID_RECURRENCE_RULES)
+
+
 def get_integer_input(prompt: str) -> int:
     """Get validated integer input from user.
 
@@ -54,17 +63,18 @@ def get_priority_input() -> Optional[str]:
     Returns:
         Optional[str]: Priority value ("low"|"medium"|"high") or None if skipped
     """
-    print(f"Enter priority ({'/'.join(VALID_PRIORITIES)}) or press Enter to skip: ", end="")
-    value = input().strip().lower()
+    while True:
+        print(f"Enter priority ({_PRIORITY_CHOICES}) or press Enter to skip: ", end="")
+        value = input().strip().lower()
 
-    if not value:
-        return None
+        if not value:
+            return None
 
-    if value not in VALID_PRIORITIES:
-        print(f"Invalid priority. Must be one of: {', '.join(VALID_PRIORITIES)}")
-        return get_priority_input()
+        if value not in _PRIORITY_SET:
+            print(f"Invalid priority. Must be one of: {_PRIORITY_LIST}")
+            continue
 
-    return value
+        return value
 
 
 def get_category_input() -> Optional[str]:
@@ -73,17 +83,18 @@ def get_category_input() -> Optional[str]:
     Returns:
         Optional[str]: Category value or None to use default "General"
     """
-    print(f"Enter category (or press Enter for '{DEFAULT_CATEGORY}'): ", end="")
-    value = input().strip()
+    while True:
+        print(f"Enter category (or press Enter for '{DEFAULT_CATEGORY}'): ", end="")
+        value = input().strip()
 
-    if not value:
-        return None
+        if not value:
+            return None
 
-    if len(value) > MAX_CATEGORY_LENGTH:
-        print(f"Category too long. Maximum {MAX_CATEGORY_LENGTH} characters.")
-        return get_category_input()
+        if len(value) > MAX_CATEGORY_LENGTH:
+            print(f"Category too long. Maximum {MAX_CATEGORY_LENGTH} characters.")
+            continue
 
-    return value
+        return value
 
 
 def get_due_date_input() -> Optional[datetime]:
@@ -92,19 +103,18 @@ def get_due_date_input() -> Optional[datetime]:
     Returns:
         Optional[datetime]: Due date value or None if skipped
     """
-    print("Enter due date (YYYY-MM-DD) or press Enter to skip: ", end="")
-    value = input().strip()
+    while True:
+        print("Enter due date (YYYY-MM-DD) or press Enter to skip: ", end="")
+        value = input().strip()
 
-    if not value:
-        return None
+        if not value:
+            return None
 
-    try:
-        # Parse the date string
-        due_date = datetime.strptime(value, "%Y-%m-%d")
-        return due_date
-    except ValueError:
-        print("Invalid date format. Please use YYYY-MM-DD (e.g., 2026-12-31)")
-        return get_due_date_input()
+        try:
+            # Parse the date string (fromisoformat is a C fast path for YYYY-MM-DD)
+            return datetime.fromisoformat(value)
+        except ValueError:
+            print("Invalid date format. Please use YYYY-MM-DD (e.g., 2026-12-31)")
 
 
 def get_recurrence_rule_input() -> Optional[str]:
@@ -113,32 +123,41 @@ def get_recurrence_rule_input() -> Optional[str]:
     Returns:
         Optional[str]: Recurrence rule value ("daily"|"weekly"|"monthly") or None if skipped
     """
-    print(f"Enter recurrence ({'/'.join(VALID_RECURRENCE_RULES)}) or press Enter to skip: ", end="")
-    value = input().strip().lower()
+    while True:
+        print(f"Enter recurrence ({_RECURRENCE_CHOICES}) or press Enter to skip: ", end="")
+        value = input().strip().lower()
 
-    if not value:
-        return None
+        if not value:
+            return None
 
-    if value not in VALID_RECURRENCE_RULES:
-        print(f"Invalid recurrence rule. Must be one of: {', '.join(VALID_RECURRENCE_RULES)}")
-        return get_recurrence_rule_input()
+        if value not in _RECURRENCE_SET:
+            print(f"Invalid recurrence rule. Must be one of: {_RECURRENCE_LIST}")
+            continue
 
-    return value
+        return value
 
 
-def add_task_command(manager: TaskManager) -> None:
+def add_task_command(
+    manager: TaskManager,
+    # Default-arg bindings turn LOAD_GLOBAL lookups into LOAD_FAST
+    _string=get_string_input,
+    _priority=get_priority_input,
+    _category=get_category_input,
+    _due_date=get_due_date_input,
+    _recurrence=get_recurrence_rule_input,
+) -> None:
     """Handle add task user command.
 
     Args:
         manager: TaskManager instance to add task to
     """
     try:
-        title = get_string_input("Enter title: ", allow_empty=False, max_length=200)
-        description = get_string_input("Enter description (optional, press Enter to skip): ", allow_empty=True, max_length=1000)
-        priority = get_priority_input()
-        category = get_category_input()
-        due_date = get_due_date_input()
-        recurrence_rule = get_recurrence_rule_input()
+        title = _string("Enter title: ", allow_empty=False, max_length=200)
+        description = _string("Enter description (optional, press Enter to skip): ", allow_empty=True, max_length=1000)
+        priority = _priority()
+        category = _category()
+        due_date = _due_date()
+        recurrence_rule = _recurrence()
 
         task = manager.add_task(title, description, priority=priority, category=category, due_date=due_date, recurrence_rule=recurrence_rule)
         print(f"✓ Task created successfully! ID: {task.id}")
@@ -158,51 +177,61 @@ def view_tasks_command(manager: TaskManager) -> None:
     print(formatted_list)
 
 
-def mark_complete_command(manager: TaskManager) -> None:
-    """Handle mark task complete user command.
+def _mark_command(manager: TaskManager, is_complete: bool) -> None:
+    """Shared implementation for the mark complete/incomplete commands.
 
     Args:
         manager: TaskManager instance to mark task in
+        is_complete: True to mark complete, False to mark incomplete
     """
     try:
         task_id = get_integer_input("Enter task ID: ")
-        manager.mark_complete(task_id, True)
-        print("✓ Task marked as complete!")
+        manager.mark_complete(task_id, is_complete)
+        print(f"✓ Task marked as {'complete' if is_complete else 'incomplete'}!")
 
     except ValueError as e:
         print(f"✗ Error: {e}")
 
 
+def mark_complete_command(manager: TaskManager) -> None:
+    """Handle mark task complete user command.
+
+    Args:
+        manager: TaskManager instance to mark task in
+    """
+    _mark_command(manager, True)
+
+
 def mark_incomplete_command(manager: TaskManager) -> None:
     """Handle mark task incomplete user command.
 
     Args:
         manager: TaskManager instance to mark task in
     """
-    try:
-        task_id = get_integer_input("Enter task ID: ")
-        manager.mark_complete(task_id, False)
-        print("✓ Task marked as incomplete!")
-
-    except ValueError as e:
-        print(f"✗ Error: {e}")
+    _mark_command(manager, False)
 
 
-def update_task_command(manager: TaskManager) -> None:
+def update_task_command(
+    manager: TaskManager,
+    _integer=get_integer_input,
+    _priority=get_priority_input,
+    _category=get_category_input,
+    _due_date=get_due_date_input,
+) -> None:
     """Handle update task user command.
 
     Args:
         manager: TaskManager instance to update task in
     """
     try:
-        task_id = get_integer_input("Enter task ID: ")
+        task_id = _integer("Enter task ID: ")
 
         print("Leave blank to keep current value")
         title = input("Enter new title (or press Enter to skip): ").strip()
         description = input("Enter new description (or press Enter to skip): ").strip()
-        priority = get_priority_input()
-        category = get_category_input()
-        due_date = get_due_date_input()
+        priority = _priority()
+        category = _category()
+        due_date = _due_date()
 
         # Convert empty strings to None for the update_task method
         title_value = title if title else None
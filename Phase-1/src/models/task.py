@@ -1,11 +1,15 @@
 """Task model for the Todo application."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
+# Integer sort rank per priority (lower sorts first, None last); cached on
+# each Task so priority sorts compare small ints instead of strings
+PRIORITY_RANK = {"high": 0, "medium": 1, "low": 2, None: 3}
 
-@dataclass
+
+@dataclass(slots=True)
 class Task:
     """Represents a single todo item with intermediate/advanced features.
 
@@ -32,3 +36,22 @@ class Task:
     category: Optional[str] = None
     due_date: Optional[datetime] = None
     recurrence_rule: Optional[str] = None
+
+    # Cached "YYYY-MM-DD" render of due_date, maintained by TaskManager so the
+    # display path never re-runs strftime for unchanged dates
+    _due_date_str: Optional[str] = field(default=None, repr=False, compare=False)
+
+    # Cached lowercase title/description so search_tasks never re-lowercases
+    # unchanged text (refreshed by TaskManager on update)
+    _title_lc: str = field(default="", repr=False, compare=False)
+    _description_lc: str = field(default="", repr=False, compare=False)
+
+    # Cached integer priority rank so sort_tasks compares ints, not strings
+    # (refreshed by TaskManager when priority changes)
+    _priority_rank: int = field(default=PRIORITY_RANK[None], repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Populate the lowercase search and priority-rank caches."""
+        self._title_lc = self.title.casefold()
+        self._description_lc = self.description.casefold()
+        self._priority_rank = PRIORITY_RANK[self.priority]
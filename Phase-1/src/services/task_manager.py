@@ -1,8 +1,10 @@
 """TaskManager service for managing tasks in memory."""
 
-from typing import Dict, List, Optional
-from datetime import datetime
-from src.models.task import Task
+import heapq
+import sys
+from typing import Callable, Dict, List, Optional
+from datetime import datetime, timedelta
+from src.models.task import PRIORITY_RANK, Task
 
 
 # Constants for validation
@@ -12,6 +14,7 @@ INITIAL_TASK_ID = 1
 
 # Phase-2: Priority validation
 VALID_PRIORITIES = ["low", "medium", "high"]
+_VALID_PRIORITY_SET = frozenset(VALID_PRIORITIES)  # O(1) membership checks
 
 # Phase-2: Category validation
 MAX_CATEGORY_LENGTH = 50
@@ -19,6 +22,58 @@ DEFAULT_CATEGORY = "General"
 
 # Phase-2: Recurrence validation
 VALID_RECURRENCE_RULES = ["daily", "weekly", "monthly"]
+_VALID_RECURRENCE_SET = frozenset(VALID_RECURRENCE_RULES)  # O(1) membership checks
+
+# Precomputed recurrence steps (avoids building a timedelta per completion)
+_ONE_DAY = timedelta(days=1)
+_ONE_WEEK = timedelta(weeks=1)
+
+# Month lengths for the monthly recurrence rollover (February adjusted for
+# leap years at lookup time); avoids a calendar.monthrange call per rollover
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _is_leap(year: int) -> bool:
+    """Return True if year is a Gregorian leap year."""
+    return (year % 4 == 0 and year % 100 != 0) or year % 400 == 0
+
+
+def _next_monthly(due: datetime) -> datetime:
+    """Return the monthly-recurrence successor of a due date.
+
+    Rolls forward one month, clamping the day to the last day of the
+    next month (e.g. Jan 31 -> Feb 28/29).
+    """
+    year = due.year
+    month = due.month
+
+    if month == 12:
+        next_year = year + 1
+        next_month = 1
+    else:
+        next_year = year
+        next_month = month + 1
+
+    # Last day of the next month via table lookup (leap-adjusted Feb)
+    last_day = _DAYS_IN_MONTH[next_month - 1]
+    if next_month == 2 and _is_leap(next_year):
+        last_day = 29
+
+    return due.replace(year=next_year, month=next_month, day=min(due.day, last_day))
+
+
+# Recurrence dispatch: one dict lookup replaces the if/elif cascade on the
+# rule string, and .get(None) cleanly short-circuits non-recurring tasks
+_RECUR_NEXT = {
+    "daily": lambda due: due + _ONE_DAY,
+    "weekly": lambda due: due + _ONE_WEEK,
+    "monthly": _next_monthly,
+}
+
+
+# Sort support: far-future sentinel used to push tasks without a due date
+# to the end (priority ranks are cached on each Task at creation time)
+_DATETIME_MAX = datetime.max
 
 
 def validate_priority(priority: Optional[str]) -> None:
@@ -30,7 +85,7 @@ def validate_priority(priority: Optional[str]) -> None:
     Raises:
         ValueError: If priority is not None and not in VALID_PRIORITIES
     """
-    if priority is not None and priority not in VALID_PRIORITIES:
+    if priority is not None and priority not in _VALID_PRIORITY_SET:
         raise ValueError(f"Priority must be one of {VALID_PRIORITIES}, got: {priority}")
 
 
@@ -50,11 +105,13 @@ def validate_category(category: Optional[str]) -> None:
             raise ValueError(f"Category exceeds maximum length of {MAX_CATEGORY_LENGTH} characters")
 
 
-def validate_due_date(due_date: Optional[datetime]) -> None:
+def validate_due_date(due_date: Optional[datetime], now: Optional[datetime] = None) -> None:
     """Validate due_date value.
 
     Args:
         due_date: Due date value to validate (or None)
+        now: Reference timestamp (optional, defaults to datetime.now();
+            TaskManager passes its own clock so tests can freeze time)
 
     Raises:
         ValueError: If due_date is in the past (before today)
@@ -62,7 +119,8 @@ def validate_due_date(due_date: Optional[datetime]) -> None:
     if due_date is not None:
         # Compare dates only (ignore time component)
         # Allow today's date, but not past dates
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         if due_date.date() < now.date():
             raise ValueError("Due date must be in the future")
 
@@ -76,7 +134,7 @@ def validate_recurrence_rule(recurrence_rule: Optional[str]) -> None:
     Raises:
         ValueError: If recurrence_rule is not None and not in VALID_RECURRENCE_RULES
     """
-    if recurrence_rule is not None and recurrence_rule not in VALID_RECURRENCE_RULES:
+    if recurrence_rule is not None and recurrence_rule not in _VALID_RECURRENCE_SET:
         raise ValueError(f"Recurrence rule must be one of {VALID_RECURRENCE_RULES}, got: {recurrence_rule}")
 
 
@@ -93,12 +151,70 @@ class TaskManager:
     Storage:
     - tasks: Dict[int, Task] - ID to Task mapping
     - next_id: int - Counter for sequential ID assignment (starts at 1)
+
+    Note:
+        Query helpers (get_all_tasks, search_tasks, filter_tasks, sort_tasks,
+        and the date-bucket methods) return materialized List[Task] objects,
+        not generators. Display consumers like format_task_list rely on a
+        single already-built list, and the C-implemented str.join over that
+        list is the fast path for rendering — keep returns as lists.
     """
 
-    def __init__(self) -> None:
-        """Initialize empty TaskManager with no tasks."""
+    def __init__(self, clock: Callable[[], datetime] = datetime.now) -> None:
+        """Initialize empty TaskManager with no tasks.
+
+        Args:
+            clock: Callable returning the current time (defaults to
+                datetime.now; tests inject a frozen clock to make
+                due-date behavior deterministic)
+        """
         self.tasks: Dict[int, Task] = {}
         self.next_id: int = INITIAL_TASK_ID
+        self._now = clock
+
+        # Secondary indexes: task IDs bucketed by field value, maintained
+        # incrementally so filter_tasks can intersect sets instead of
+        # scanning every task
+        self._by_priority: Dict[Optional[str], set] = {}
+        self._by_category: Dict[str, set] = {}
+        self._by_complete: Dict[bool, set] = {False: set(), True: set()}
+
+        # IDs of tasks that have a due date, so date-bucket queries skip
+        # tasks without one entirely
+        self._with_due_date: set = set()
+
+        # Trigram search index: 3-gram of lowercased title/description ->
+        # candidate task IDs. Queries of length >= 3 intersect postings and
+        # verify with a substring check instead of scanning every task.
+        # Maintained lazily: mutations only flip the dirty flag, and the
+        # index is rebuilt on the next search (so bulk ingest pays nothing)
+        self._trigram_index: Dict[str, set] = {}
+        self._trigram_dirty: bool = False
+
+        # Memoized "all tasks" list for the no-criteria filter path;
+        # invalidated whenever a task is added or deleted (in-place updates
+        # keep the same Task objects, so the cached list stays valid)
+        self._all_cache: Optional[List[Task]] = None
+
+    @staticmethod
+    def _search_text(task: Task) -> str:
+        """Build the lowercased searchable text for a task."""
+        return f"{task._title_lc}\n{task._description_lc}"
+
+    def _index_search_text(self, task_id: int, text: str) -> None:
+        """Add a task's trigrams to the search index."""
+        index = self._trigram_index
+        for i in range(len(text) - 2):
+            index.setdefault(text[i:i + 3], set()).add(task_id)
+
+    def _rebuild_search_index(self) -> None:
+        """Rebuild the trigram index from scratch and clear the dirty flag."""
+        self._trigram_index.clear()
+        search_text = self._search_text
+        index = self._index_search_text
+        for task in self.tasks.values():
+            index(task.id, search_text(task))
+        self._trigram_dirty = False
 
     def _calculate_next_due_date(self, current_due_date: datetime, recurrence_rule: str) -> datetime:
         """Calculate next due date based on recurrence rule.
@@ -110,37 +226,11 @@ class TaskManager:
         Returns:
             datetime: Next due date based on recurrence rule
         """
-        from datetime import timedelta
-        from calendar import monthrange
-
-        if recurrence_rule == "daily":
-            return current_due_date + timedelta(days=1)
-        elif recurrence_rule == "weekly":
-            return current_due_date + timedelta(weeks=1)
-        elif recurrence_rule == "monthly":
-            # Handle monthly recurrence with edge case for end of month
-            year = current_due_date.year
-            month = current_due_date.month
-            day = current_due_date.day
-
-            # Calculate next month
-            if month == 12:
-                next_year = year + 1
-                next_month = 1
-            else:
-                next_year = year
-                next_month = month + 1
-
-            # Get the last day of the next month
-            last_day_of_next_month = monthrange(next_year, next_month)[1]
-
-            # Use the same day, or last day if original day doesn't exist in next month
-            next_day = min(day, last_day_of_next_month)
-
-            return current_due_date.replace(year=next_year, month=next_month, day=next_day)
-        else:
+        advance = _RECUR_NEXT.get(recurrence_rule)
+        if advance is None:
             # Should not reach here due to validation, but return current date as fallback
             return current_due_date
+        return advance(current_due_date)
 
     def add_task(self, title: str, description: str = "", priority: Optional[str] = None, category: Optional[str] = None, due_date: Optional[datetime] = None, recurrence_rule: Optional[str] = None) -> Task:
         """Add a new task to the manager.
@@ -180,43 +270,149 @@ class TaskManager:
         # Validate priority
         validate_priority(priority)
 
-        # Validate and default category
+        # Validate category (defaulted in _store_new)
         validate_category(category)
-        if category is None:
-            category = DEFAULT_CATEGORY
 
         # Validate due_date
-        validate_due_date(due_date)
+        validate_due_date(due_date, self._now())
 
         # Validate recurrence_rule
         validate_recurrence_rule(recurrence_rule)
 
-        # Create task with next available ID
+        return self._store_new(title, description, priority, category, due_date, recurrence_rule)
+
+    def _store_new(self, title: str, description: str, priority: Optional[str], category: Optional[str], due_date: Optional[datetime], recurrence_rule: Optional[str]) -> Task:
+        """Create and store a task from already-validated field values.
+
+        Internal trusted path shared by add_task and the recurring-task
+        branch of mark_complete, which clones fields that were validated
+        when the original task was added.
+
+        Args:
+            title: Validated, stripped task title
+            description: Validated description
+            priority: Validated priority (or None)
+            category: Validated category (or None for the default)
+            due_date: Validated due date (or None)
+            recurrence_rule: Validated recurrence rule (or None)
+
+        Returns:
+            Task: Newly created task with assigned ID and is_complete=False
+        """
+        if category is None:
+            category = DEFAULT_CATEGORY
+
+        # Intern the small categorical strings: repeated values share one
+        # object, so filter/sort equality checks short-circuit on identity
+        priority = sys.intern(priority) if priority is not None else None
+        category = sys.intern(category)
+        recurrence_rule = sys.intern(recurrence_rule) if recurrence_rule is not None else None
+
+        # Create task with next available ID (positional args into the
+        # dataclass-generated __init__ skip keyword binding)
+        new_id = self.next_id
+        self.next_id = new_id + 1
         task = Task(
-            id=self.next_id,
-            title=title,
-            description=description,
-            is_complete=False,
-            priority=priority,
-            category=category,
-            due_date=due_date,
-            recurrence_rule=recurrence_rule
+            new_id,
+            title,
+            description,
+            False,  # is_complete
+            priority,
+            category,
+            due_date,
+            recurrence_rule,
+            due_date.strftime("%Y-%m-%d") if due_date else None,  # _due_date_str
         )
 
-        # Store task and increment ID counter
-        self.tasks[self.next_id] = task
-        self.next_id += 1
+        # Store task (the ID counter was advanced above)
+        self.tasks[new_id] = task
+        self._all_cache = None
+
+        # Maintain secondary indexes
+        self._by_priority.setdefault(priority, set()).add(task.id)
+        self._by_category.setdefault(category, set()).add(task.id)
+        self._by_complete[False].add(task.id)
+        if due_date is not None:
+            self._with_due_date.add(task.id)
+        self._trigram_dirty = True
 
         return task
 
+    def add_tasks_bulk(self, records: List[dict]) -> List[Task]:
+        """Add many tasks in one call, amortizing per-call overhead.
+
+        Validates every record up front (so a bad record adds nothing),
+        then stores them all through the trusted creation path.
+
+        Args:
+            records: List of dicts of add_task keyword arguments
+                (title required; description/priority/category/due_date/
+                recurrence_rule optional)
+
+        Returns:
+            List[Task]: Newly created tasks in input order
+
+        Raises:
+            ValueError: If any record fails the add_task validation rules
+        """
+        # Local bindings keep the validation loop on LOAD_FAST lookups;
+        # one clock read covers every record in the batch
+        _vp = validate_priority
+        _vc = validate_category
+        _vd = validate_due_date
+        _vr = validate_recurrence_rule
+        now = self._now()
+
+        validated = []
+        for record in records:
+            title = record["title"].strip()
+            if not title:
+                raise ValueError("Title cannot be empty")
+            if len(title) > MAX_TITLE_LENGTH:
+                raise ValueError(f"Title exceeds maximum length of {MAX_TITLE_LENGTH} characters")
+
+            description = record.get("description", "")
+            if len(description) > MAX_DESCRIPTION_LENGTH:
+                raise ValueError(f"Description exceeds maximum length of {MAX_DESCRIPTION_LENGTH} characters")
+
+            priority = record.get("priority")
+            _vp(priority)
+            category = record.get("category")
+            _vc(category)
+            due_date = record.get("due_date")
+            _vd(due_date, now)
+            recurrence_rule = record.get("recurrence_rule")
+            _vr(recurrence_rule)
+
+            validated.append((title, description, priority, category, due_date, recurrence_rule))
+
+        store = self._store_new
+        return [store(*fields) for fields in validated]
+
+    def has_task(self, task_id: int) -> bool:
+        """Check whether a task with the given ID exists.
+
+        Args:
+            task_id: ID to look up
+
+        Returns:
+            bool: True if the task exists, False otherwise
+        """
+        return task_id in self.tasks
+
+    def __len__(self) -> int:
+        """Return the number of stored tasks."""
+        return len(self.tasks)
+
     def get_all_tasks(self) -> List[Task]:
         """Get all tasks sorted by ID (creation order).
 
         Returns:
             List[Task]: All tasks in ascending ID order (empty list if no tasks)
         """
-        # Return tasks sorted by ID
-        return sorted(self.tasks.values(), key=lambda t: t.id)
+        # IDs are assigned monotonically and never reused, so dict insertion
+        # order already equals ascending-ID order -- no sort needed
+        return list(self.tasks.values())
 
     def mark_complete(self, task_id: int, is_complete: bool) -> Task:
         """Mark task as complete or incomplete.
@@ -234,31 +430,82 @@ class TaskManager:
         Raises:
             ValueError: If task_id not found
         """
-        # Check if task exists
-        if task_id not in self.tasks:
-            raise ValueError(f"Task not found: {task_id}")
-
-        # Update task status
-        task = self.tasks[task_id]
+        # Single-lookup fetch; missing ID surfaces as ValueError
+        try:
+            task = self.tasks[task_id]
+        except KeyError:
+            raise ValueError(f"Task not found: {task_id}") from None
+
+        # Update task status (moving the ID between completion buckets)
+        if task.is_complete != is_complete:
+            self._by_complete[task.is_complete].discard(task_id)
+            self._by_complete[is_complete].add(task_id)
         task.is_complete = is_complete
 
         # If marking as complete and task has recurrence rule, create new instance
-        if is_complete and task.recurrence_rule and task.due_date:
-            # Calculate next due date
-            next_due_date = self._calculate_next_due_date(task.due_date, task.recurrence_rule)
-
-            # Create new instance of the recurring task
-            self.add_task(
+        advance = _RECUR_NEXT.get(task.recurrence_rule)
+        if is_complete and advance is not None and task.due_date:
+            # Create new instance of the recurring task via the trusted path:
+            # every field was validated when the original task was added, and
+            # the recurrence step always moves the date forward
+            self._store_new(
                 title=task.title,
                 description=task.description,
                 priority=task.priority,
                 category=task.category,
-                due_date=next_due_date,
+                due_date=advance(task.due_date),
                 recurrence_rule=task.recurrence_rule
             )
 
         return task
 
+    def mark_complete_bulk(self, task_ids: List[int], is_complete: bool = True) -> List[Task]:
+        """Mark many tasks complete or incomplete in one call.
+
+        Resolves every ID up front (so an unknown ID changes nothing),
+        then flips the completion buckets with locally-bound sets.
+
+        Args:
+            task_ids: IDs of tasks to update
+            is_complete: True for complete, False for incomplete (default True)
+
+        Returns:
+            List[Task]: Updated task objects in input order
+
+        Raises:
+            ValueError: If any task_id is not found
+        """
+        tasks = self.tasks
+        resolved = []
+        for task_id in task_ids:
+            try:
+                resolved.append(tasks[task_id])
+            except KeyError:
+                raise ValueError(f"Task not found: {task_id}") from None
+
+        from_bucket = self._by_complete[not is_complete]
+        to_bucket = self._by_complete[is_complete]
+        for task in resolved:
+            if task.is_complete != is_complete:
+                from_bucket.discard(task.id)
+                to_bucket.add(task.id)
+            task.is_complete = is_complete
+
+            # Recurring tasks spawn their next instance on completion,
+            # same as the single-task path
+            advance = _RECUR_NEXT.get(task.recurrence_rule)
+            if is_complete and advance is not None and task.due_date:
+                self._store_new(
+                    title=task.title,
+                    description=task.description,
+                    priority=task.priority,
+                    category=task.category,
+                    due_date=advance(task.due_date),
+                    recurrence_rule=task.recurrence_rule
+                )
+
+        return resolved
+
     def update_task(self, task_id: int, title: Optional[str] = None, description: Optional[str] = None, priority: Optional[str] = None, category: Optional[str] = None, due_date: Optional[datetime] = None) -> Task:
         """Update task title and/or description and/or priority and/or category and/or due_date.
 
@@ -283,16 +530,16 @@ class TaskManager:
             ValueError: If category is empty/whitespace or exceeds MAX_CATEGORY_LENGTH
             ValueError: If due_date is in the past
         """
-        # Check if task exists
-        if task_id not in self.tasks:
-            raise ValueError(f"Task not found: {task_id}")
+        # Single-lookup fetch; missing ID surfaces as ValueError
+        try:
+            task = self.tasks[task_id]
+        except KeyError:
+            raise ValueError(f"Task not found: {task_id}") from None
 
         # Ensure at least one field is provided
         if title is None and description is None and priority is None and category is None and due_date is None:
             raise ValueError("Must provide at least one field to update")
 
-        task = self.tasks[task_id]
-
         # Update title if provided
         if title is not None:
             title = title.strip()
@@ -301,27 +548,42 @@ class TaskManager:
             if len(title) > MAX_TITLE_LENGTH:
                 raise ValueError(f"Title exceeds maximum length of {MAX_TITLE_LENGTH} characters")
             task.title = title
+            task._title_lc = title.casefold()
+            # Flag immediately after the assignment: a later field failing
+            # validation must not leave the applied title unindexed
+            self._trigram_dirty = True
 
         # Update description if provided
         if description is not None:
             if len(description) > MAX_DESCRIPTION_LENGTH:
                 raise ValueError(f"Description exceeds maximum length of {MAX_DESCRIPTION_LENGTH} characters")
             task.description = description
+            task._description_lc = description.casefold()
+            self._trigram_dirty = True
 
-        # Update priority if provided
+        # Update priority if provided (rebucket the ID under the new value)
         if priority is not None:
             validate_priority(priority)
+            priority = sys.intern(priority)
+            self._by_priority[task.priority].discard(task_id)
+            self._by_priority.setdefault(priority, set()).add(task_id)
             task.priority = priority
+            task._priority_rank = PRIORITY_RANK[priority]
 
-        # Update category if provided
+        # Update category if provided (rebucket the ID under the new value)
         if category is not None:
             validate_category(category)
+            category = sys.intern(category)
+            self._by_category[task.category].discard(task_id)
+            self._by_category.setdefault(category, set()).add(task_id)
             task.category = category
 
         # Update due_date if provided
         if due_date is not None:
-            validate_due_date(due_date)
+            validate_due_date(due_date, self._now())
             task.due_date = due_date
+            task._due_date_str = due_date.strftime("%Y-%m-%d")
+            self._with_due_date.add(task_id)
 
         return task
 
@@ -334,12 +596,19 @@ class TaskManager:
         Raises:
             ValueError: If task_id not found
         """
-        # Check if task exists
-        if task_id not in self.tasks:
-            raise ValueError(f"Task not found: {task_id}")
-
-        # Remove task from storage
-        del self.tasks[task_id]
+        # Remove task from storage; missing ID surfaces as ValueError
+        try:
+            task = self.tasks.pop(task_id)
+        except KeyError:
+            raise ValueError(f"Task not found: {task_id}") from None
+
+        # Remove the ID from all secondary indexes
+        self._by_priority[task.priority].discard(task_id)
+        self._by_category[task.category].discard(task_id)
+        self._by_complete[task.is_complete].discard(task_id)
+        self._with_due_date.discard(task_id)
+        self._trigram_dirty = True
+        self._all_cache = None
 
     def search_tasks(self, keyword: str) -> List[Task]:
         """Search tasks by keyword in title or description (case-insensitive).
@@ -350,15 +619,36 @@ class TaskManager:
         Returns:
             List[Task]: Tasks matching the keyword, sorted by ID
         """
-        keyword_lower = keyword.lower()
-        matching_tasks = []
-
-        for task in self.get_all_tasks():
-            # Case-insensitive search in title and description
-            if keyword_lower in task.title.lower() or keyword_lower in task.description.lower():
-                matching_tasks.append(task)
-
-        return matching_tasks
+        keyword_lower = keyword.casefold()
+
+        # Queries of length >= 3 narrow candidates through the trigram index
+        # (O(|query| + |candidates|)), then verify with a substring check
+        if len(keyword_lower) >= 3:
+            if self._trigram_dirty:
+                self._rebuild_search_index()
+            index = self._trigram_index
+            postings = []
+            for i in range(len(keyword_lower) - 2):
+                bucket = index.get(keyword_lower[i:i + 3])
+                if not bucket:
+                    return []
+                postings.append(bucket)
+
+            candidates = postings[0].intersection(*postings[1:])
+            tasks = self.tasks
+            return [
+                tasks[task_id]
+                for task_id in sorted(candidates)
+                if keyword_lower in tasks[task_id]._title_lc
+                or keyword_lower in tasks[task_id]._description_lc
+            ]
+
+        # Short queries fall back to a scan over the cached lowercase fields
+        return [
+            task
+            for task in self.tasks.values()
+            if keyword_lower in task._title_lc or keyword_lower in task._description_lc
+        ]
 
     def filter_tasks(
         self,
@@ -378,31 +668,37 @@ class TaskManager:
         Returns:
             List[Task]: Tasks matching all specified criteria, sorted by ID
         """
-        matching_tasks = []
-
-        for task in self.get_all_tasks():
-            # Check priority filter
-            if priority is not None and task.priority != priority:
-                continue
-
-            # Check category filter
-            if category is not None and task.category != category:
-                continue
+        # Gather the index buckets for the active criteria; a criterion with
+        # no bucket means no task can match
+        candidate_sets = []
+        if priority is not None:
+            candidate_sets.append(self._by_priority.get(priority, frozenset()))
+        if category is not None:
+            candidate_sets.append(self._by_category.get(category, frozenset()))
+        if is_complete is not None:
+            candidate_sets.append(self._by_complete[is_complete])
 
-            # Check completion status filter
-            if is_complete is not None and task.is_complete != is_complete:
-                continue
+        # No criteria: all tasks match; reuse the memoized list between
+        # mutations so repeated unfiltered views cost nothing. Hand out a
+        # copy so in-place sorts or appends by callers cannot corrupt the
+        # cached list
+        if not candidate_sets:
+            if self._all_cache is None:
+                self._all_cache = list(self.tasks.values())
+            return list(self._all_cache)
 
-            # All filters passed
-            matching_tasks.append(task)
+        # AND logic: intersect the buckets (cost bounded by the smallest set)
+        matching_ids = candidate_sets[0].intersection(*candidate_sets[1:])
 
-        return matching_tasks
+        return [self.tasks[task_id] for task_id in sorted(matching_ids)]
 
-    def sort_tasks(self, sort_by: str = "id") -> List[Task]:
+    def sort_tasks(self, sort_by: str = "id", limit: Optional[int] = None) -> List[Task]:
         """Sort tasks by specified key.
 
         Args:
             sort_by: Sort key ("id"|"priority"|"title"|"due_date", default "id")
+            limit: Return only the first N results (optional; uses a heap
+                top-k selection in O(N log k) instead of a full sort)
 
         Returns:
             List[Task]: Tasks sorted by specified key, with secondary sort by ID for ties
@@ -415,33 +711,32 @@ class TaskManager:
         """
         tasks = self.get_all_tasks()
 
+        # Decorate-sort-undecorate: build (key, id, task) tuples once, sort
+        # them without a key function (tuple comparison runs in C, and the
+        # unique ID tiebreaker keeps Task itself out of the comparisons)
         if sort_by == "priority":
-            # Define priority order: high=0, medium=1, low=2, None=3
-            priority_order = {"high": 0, "medium": 1, "low": 2}
-
-            def priority_key(task):
-                return (priority_order.get(task.priority, 3), task.id)
-
-            return sorted(tasks, key=priority_key)
+            # Ranks are cached on the task (high=0 .. None=3), so the sort
+            # compares plain ints instead of re-deriving from the string
+            decorated = [(task._priority_rank, task.id, task) for task in tasks]
 
         elif sort_by == "title":
             # Sort alphabetically by title (case-insensitive), then by ID
-            return sorted(tasks, key=lambda task: (task.title.lower(), task.id))
+            decorated = [(task._title_lc, task.id, task) for task in tasks]
 
         elif sort_by == "due_date":
-            # Sort by due date (soonest first), None values last, then by ID
-            def due_date_key(task):
-                if task.due_date is None:
-                    # Use a far future date for None values to sort them last
-                    from datetime import datetime
-                    return (datetime.max, task.id)
-                return (task.due_date, task.id)
-
-            return sorted(tasks, key=due_date_key)
+            # Sort by due date (soonest first), far-future sentinel pushes
+            # None values last, then by ID
+            decorated = [(task.due_date or _DATETIME_MAX, task.id, task) for task in tasks]
 
         else:  # sort_by == "id" or any other value defaults to ID
-            # Already sorted by ID in get_all_tasks(), but explicit for clarity
-            return sorted(tasks, key=lambda task: task.id)
+            # get_all_tasks() is already in ascending-ID order
+            return tasks[:limit] if limit is not None else tasks
+
+        if limit is not None:
+            return [entry[2] for entry in heapq.nsmallest(limit, decorated)]
+
+        decorated.sort()
+        return [entry[2] for entry in decorated]
 
     def get_overdue_tasks(self) -> List[Task]:
         """Get all incomplete tasks with due_date in the past.
@@ -449,14 +744,17 @@ class TaskManager:
         Returns:
             List[Task]: Incomplete tasks with past due dates, sorted by ID
         """
-        now = datetime.now()
+        today_ord = self._now().toordinal()
         overdue_tasks = []
+        tasks = self.tasks
 
-        for task in self.get_all_tasks():
+        for task_id in sorted(self._with_due_date):
             # Only include incomplete tasks with a due date in the past
-            if not task.is_complete and task.due_date is not None:
-                if task.due_date.date() < now.date():
-                    overdue_tasks.append(task)
+            # (toordinal() ignores the time component, so this is a pure
+            # integer compare with no date object allocation)
+            task = tasks[task_id]
+            if not task.is_complete and task.due_date.toordinal() < today_ord:
+                overdue_tasks.append(task)
 
         return overdue_tasks
 
@@ -466,17 +764,50 @@ class TaskManager:
         Returns:
             List[Task]: Tasks due today, sorted by ID
         """
-        now = datetime.now()
+        today_ord = self._now().toordinal()
         today_tasks = []
+        tasks = self.tasks
 
-        for task in self.get_all_tasks():
-            # Include tasks with due date matching today
-            if task.due_date is not None:
-                if task.due_date.date() == now.date():
-                    today_tasks.append(task)
+        for task_id in sorted(self._with_due_date):
+            # Include tasks with due date matching today (integer compare)
+            task = tasks[task_id]
+            if task.due_date.toordinal() == today_ord:
+                today_tasks.append(task)
 
         return today_tasks
 
+    def get_due_buckets(self, days: int = 7) -> tuple:
+        """Count overdue, due-today, and upcoming tasks in a single pass.
+
+        Equivalent to len() over get_overdue_tasks(), get_tasks_due_today(),
+        and get_upcoming_tasks(days), but walks the task store once and
+        allocates no intermediate lists.
+
+        Args:
+            days: Number of days to look ahead for the upcoming count (default: 7)
+
+        Returns:
+            tuple: (overdue_count, today_count, upcoming_count)
+        """
+        today_ord = self._now().toordinal()
+        cutoff_ord = today_ord + days
+
+        overdue_count = today_count = upcoming_count = 0
+
+        tasks = self.tasks
+        for task_id in self._with_due_date:
+            task = tasks[task_id]
+            task_ord = task.due_date.toordinal()
+            if task_ord < today_ord:
+                if not task.is_complete:
+                    overdue_count += 1
+            elif task_ord == today_ord:
+                today_count += 1
+            elif task_ord <= cutoff_ord:
+                upcoming_count += 1
+
+        return (overdue_count, today_count, upcoming_count)
+
     def get_upcoming_tasks(self, days: int = 7) -> List[Task]:
         """Get all tasks due in the next N days (excluding today and overdue).
 
@@ -486,19 +817,16 @@ class TaskManager:
         Returns:
             List[Task]: Tasks due in the next N days, sorted by ID
         """
-        from datetime import timedelta
-
-        now = datetime.now()
-        today = now.date()
-        end_date = (now + timedelta(days=days)).date()
+        today_ord = self._now().toordinal()
+        end_ord = today_ord + days
 
         upcoming_tasks = []
+        tasks = self.tasks
 
-        for task in self.get_all_tasks():
-            # Include tasks with due date between tomorrow and end_date
-            if task.due_date is not None:
-                task_date = task.due_date.date()
-                if today < task_date <= end_date:
-                    upcoming_tasks.append(task)
+        for task_id in sorted(self._with_due_date):
+            # Include tasks due between tomorrow and end_ord (integer compares)
+            task = tasks[task_id]
+            if today_ord < task.due_date.toordinal() <= end_ord:
+                upcoming_tasks.append(task)
 
         return upcoming_tasks
@@ -0,0 +1,26 @@
+"""Shared fixtures for the Phase-1 test suite.
+
+Every test here is independent: fixtures are function-scoped (or
+module-scoped and read-only) and no session-level mutable state exists,
+so the suite is safe to distribute with pytest-xdist (`pytest -n auto`).
+"""
+
+import pytest
+from datetime import datetime
+from src.services.task_manager import TaskManager
+
+
+@pytest.fixture
+def fresh_manager():
+    """Provide an empty TaskManager instance."""
+    return TaskManager()
+
+
+@pytest.fixture
+def now():
+    """Provide a single frozen timestamp for a test.
+
+    Reading the clock once per test keeps all derived offsets consistent
+    and avoids midnight races between consecutive datetime.now() calls.
+    """
+    return datetime.now()
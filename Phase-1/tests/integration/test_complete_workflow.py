@@ -4,9 +4,9 @@ import pytest
 from src.services.task_manager import TaskManager
 
 
-def test_complete_user_workflow():
+def test_complete_user_workflow(fresh_manager):
     """Test complete workflow: add → categorize → prioritize → filter → search → sort → complete."""
-    manager = TaskManager()
+    manager = fresh_manager
 
     # Step 1: Add tasks
     task1 = manager.add_task(
@@ -90,9 +90,10 @@ def test_complete_user_workflow():
 
     # Verify completion status
     completed_tasks = manager.filter_tasks(is_complete=True)
+    completed_ids = {t.id for t in completed_tasks}
     assert len(completed_tasks) == 2
-    assert task1.id in [t.id for t in completed_tasks]
-    assert task4.id in [t.id for t in completed_tasks]
+    assert task1.id in completed_ids
+    assert task4.id in completed_ids
 
     # Step 10: Filter incomplete tasks
     incomplete_tasks = manager.filter_tasks(is_complete=False)
@@ -102,7 +103,7 @@ def test_complete_user_workflow():
     manager.delete_task(task2.id)
     remaining_tasks = manager.get_all_tasks()
     assert len(remaining_tasks) == 3
-    assert task2.id not in [t.id for t in remaining_tasks]
+    assert task2.id not in {t.id for t in remaining_tasks}
 
     # Step 12: Verify final state
     final_tasks = manager.get_all_tasks()
@@ -113,9 +114,9 @@ def test_complete_user_workflow():
     assert len(manager.sort_tasks(sort_by="priority")) == 3
 
 
-def test_workflow_with_edge_cases():
+def test_workflow_with_edge_cases(fresh_manager):
     """Test workflow with edge cases and boundary conditions."""
-    manager = TaskManager()
+    manager = fresh_manager
 
     # Add task with all optional fields as None/default
     task1 = manager.add_task("Minimal task")
@@ -1,9 +1,7 @@
 """Integration tests for full user workflows."""
 
-from src.services.task_manager import TaskManager
 
-
-def test_add_and_view_workflow():
+def test_add_and_view_workflow(fresh_manager):
     """Test complete add and view workflow (User Story 1).
 
     Integration test covering:
@@ -11,7 +9,7 @@ def test_add_and_view_workflow():
     - View task list
     - Verify task appears with correct details and status
     """
-    manager = TaskManager()
+    manager = fresh_manager
 
     # Add first task
     task1 = manager.add_task("Buy groceries", "Milk, eggs, bread")
@@ -39,9 +37,9 @@ def test_add_and_view_workflow():
     assert tasks[1].is_complete is False
 
 
-def test_empty_list_workflow():
+def test_empty_list_workflow(fresh_manager):
     """Test viewing empty task list returns appropriate empty list."""
-    manager = TaskManager()
+    manager = fresh_manager
 
     tasks = manager.get_all_tasks()
 
@@ -49,11 +47,11 @@ def test_empty_list_workflow():
     assert len(tasks) == 0
 
 
-def test_empty_list_display_message():
+def test_empty_list_display_message(fresh_manager):
     """Test that empty task list displays helpful message."""
     from src.cli.display import format_task_list
 
-    manager = TaskManager()
+    manager = fresh_manager
     tasks = manager.get_all_tasks()
     formatted = format_task_list(tasks)
 
@@ -61,7 +59,7 @@ def test_empty_list_display_message():
     assert "Add a task to get started" in formatted
 
 
-def test_mark_complete_workflow():
+def test_mark_complete_workflow(fresh_manager):
     """Test complete mark complete/incomplete workflow (User Story 2).
 
     Integration test covering:
@@ -71,7 +69,7 @@ def test_mark_complete_workflow():
     - Mark task as incomplete
     - Verify status indicators work correctly
     """
-    manager = TaskManager()
+    manager = fresh_manager
 
     # Add tasks
     task1 = manager.add_task("Buy groceries", "Milk, eggs")
@@ -75,29 +75,30 @@ class TestMarkCompleteRecurrenceWeekly:
 
 
 class TestMarkCompleteRecurrenceMonthly:
-    """Tests for mark_complete with monthly recurrence."""
+    """Tests for mark_complete with monthly recurrence.
 
-    def test_mark_complete_monthly_creates_new_instance(self, empty_manager):
+    These tests freeze the manager's clock so specific calendar dates
+    stay valid forever instead of drifting into the past.
+    """
+
+    def test_mark_complete_monthly_creates_new_instance(self):
         """Test marking monthly recurring task complete creates new instance for next month."""
         # Use a specific date to test monthly recurrence
-        from datetime import datetime
         current_date = datetime(2026, 1, 15)
+        manager = TaskManager(clock=lambda: current_date)
 
         # Create monthly recurring task
-        task = empty_manager.add_task(
+        task = manager.add_task(
             "Monthly report",
             due_date=current_date,
             recurrence_rule="monthly"
         )
 
-        # Manually set due_date to current_date for testing
-        task.due_date = current_date
-
         # Mark complete
-        empty_manager.mark_complete(task.id, True)
+        manager.mark_complete(task.id, True)
 
         # Verify new instance created
-        all_tasks = empty_manager.get_all_tasks()
+        all_tasks = manager.get_all_tasks()
         assert len(all_tasks) == 2
 
         new_task = [t for t in all_tasks if not t.is_complete][0]
@@ -106,53 +107,45 @@ class TestMarkCompleteRecurrenceMonthly:
         assert new_task.due_date.date() == datetime(2026, 2, 15).date()
         assert new_task.recurrence_rule == "monthly"
 
-    def test_monthly_recurrence_edge_case_jan_31_to_feb_28(self, empty_manager):
+    def test_monthly_recurrence_edge_case_jan_31_to_feb_28(self):
         """Test monthly recurrence from Jan 31 creates Feb 28 (non-leap year)."""
-        from datetime import datetime
-
         # Jan 31, 2026 (2026 is not a leap year)
         jan_31 = datetime(2026, 1, 31)
+        manager = TaskManager(clock=lambda: jan_31)
 
-        task = empty_manager.add_task(
+        task = manager.add_task(
             "End of month task",
             due_date=jan_31,
             recurrence_rule="monthly"
         )
 
-        # Manually set due_date for testing
-        task.due_date = jan_31
-
         # Mark complete
-        empty_manager.mark_complete(task.id, True)
+        manager.mark_complete(task.id, True)
 
         # Verify new instance has Feb 28 (last day of February in non-leap year)
-        all_tasks = empty_manager.get_all_tasks()
+        all_tasks = manager.get_all_tasks()
         new_task = [t for t in all_tasks if not t.is_complete][0]
 
         # Feb only has 28 days in 2026
         assert new_task.due_date.date() == datetime(2026, 2, 28).date()
 
-    def test_monthly_recurrence_edge_case_dec_to_jan_next_year(self, empty_manager):
+    def test_monthly_recurrence_edge_case_dec_to_jan_next_year(self):
         """Test monthly recurrence from December rolls over to January next year."""
-        from datetime import datetime
-
         # Dec 15, 2026
         dec_15 = datetime(2026, 12, 15)
+        manager = TaskManager(clock=lambda: dec_15)
 
-        task = empty_manager.add_task(
+        task = manager.add_task(
             "December task",
             due_date=dec_15,
             recurrence_rule="monthly"
         )
 
-        # Manually set due_date for testing
-        task.due_date = dec_15
-
         # Mark complete
-        empty_manager.mark_complete(task.id, True)
+        manager.mark_complete(task.id, True)
 
         # Verify new instance has Jan 15, 2027 (next year)
-        all_tasks = empty_manager.get_all_tasks()
+        all_tasks = manager.get_all_tasks()
         new_task = [t for t in all_tasks if not t.is_complete][0]
 
         assert new_task.due_date.date() == datetime(2027, 1, 15).date()
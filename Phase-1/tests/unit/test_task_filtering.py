@@ -4,30 +4,32 @@ import pytest
 from src.services.task_manager import TaskManager
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def manager_with_sample_tasks():
-    """Provide TaskManager with diverse sample tasks."""
-    manager = TaskManager()
-    # High priority work tasks
-    manager.add_task("Write report", "Quarterly financial report", priority="high", category="Work")
-    manager.add_task("Fix bug in login", "Authentication error", priority="high", category="Work")
-
-    # Medium priority personal tasks
-    manager.add_task("Buy groceries", "Milk, eggs, bread", priority="medium", category="Personal")
-    manager.add_task("Call dentist", "Schedule appointment", priority="medium", category="Personal")
-
-    # Low priority shopping tasks
-    manager.add_task("Order books", "Python programming books", priority="low", category="Shopping")
-    manager.add_task("Buy gift", "Birthday gift for mom", priority="low", category="Shopping")
+    """Provide TaskManager with diverse sample tasks.
 
-    # No priority general tasks
-    manager.add_task("Read news", "", category="General")
-    manager.add_task("Water plants", "Indoor plants need watering")  # Uses default General category
-
-    # Mark some as complete
-    manager.mark_complete(1, True)  # Write report - complete
-    manager.mark_complete(3, True)  # Buy groceries - complete
-    manager.mark_complete(7, True)  # Read news - complete
+    Module-scoped: every test in this file is read-only against the
+    manager, so the 8 tasks + 3 completions are built once instead of
+    once per test. Tests that mutate state must use their own manager.
+    """
+    manager = TaskManager()
+    manager.add_tasks_bulk([
+        # High priority work tasks
+        {"title": "Write report", "description": "Quarterly financial report", "priority": "high", "category": "Work"},
+        {"title": "Fix bug in login", "description": "Authentication error", "priority": "high", "category": "Work"},
+        # Medium priority personal tasks
+        {"title": "Buy groceries", "description": "Milk, eggs, bread", "priority": "medium", "category": "Personal"},
+        {"title": "Call dentist", "description": "Schedule appointment", "priority": "medium", "category": "Personal"},
+        # Low priority shopping tasks
+        {"title": "Order books", "description": "Python programming books", "priority": "low", "category": "Shopping"},
+        {"title": "Buy gift", "description": "Birthday gift for mom", "priority": "low", "category": "Shopping"},
+        # No priority general tasks
+        {"title": "Read news", "category": "General"},
+        {"title": "Water plants", "description": "Indoor plants need watering"},  # Uses default General category
+    ])
+
+    # Mark Write report, Buy groceries, and Read news complete
+    manager.mark_complete_bulk([1, 3, 7])
 
     return manager
 
@@ -90,42 +92,42 @@ class TestFilterTasks:
         results = manager_with_sample_tasks.filter_tasks(priority="high")
 
         assert len(results) == 2
-        assert all(task.priority == "high" for task in results)
+        assert {task.priority for task in results} == {"high"}
 
     def test_filter_tasks_by_priority_low(self, manager_with_sample_tasks):
         """Test filtering tasks by low priority."""
         results = manager_with_sample_tasks.filter_tasks(priority="low")
 
         assert len(results) == 2
-        assert all(task.priority == "low" for task in results)
+        assert {task.priority for task in results} == {"low"}
 
     def test_filter_tasks_by_category_work(self, manager_with_sample_tasks):
         """Test filtering tasks by Work category."""
         results = manager_with_sample_tasks.filter_tasks(category="Work")
 
         assert len(results) == 2
-        assert all(task.category == "Work" for task in results)
+        assert {task.category for task in results} == {"Work"}
 
     def test_filter_tasks_by_category_personal(self, manager_with_sample_tasks):
         """Test filtering tasks by Personal category."""
         results = manager_with_sample_tasks.filter_tasks(category="Personal")
 
         assert len(results) == 2
-        assert all(task.category == "Personal" for task in results)
+        assert {task.category for task in results} == {"Personal"}
 
     def test_filter_tasks_by_status_complete(self, manager_with_sample_tasks):
         """Test filtering tasks by completion status (complete)."""
         results = manager_with_sample_tasks.filter_tasks(is_complete=True)
 
         assert len(results) == 3
-        assert all(task.is_complete is True for task in results)
+        assert {task.is_complete for task in results} == {True}
 
     def test_filter_tasks_by_status_incomplete(self, manager_with_sample_tasks):
         """Test filtering tasks by completion status (incomplete)."""
         results = manager_with_sample_tasks.filter_tasks(is_complete=False)
 
         assert len(results) == 5
-        assert all(task.is_complete is False for task in results)
+        assert {task.is_complete for task in results} == {False}
 
     def test_filter_tasks_multiple_criteria_and_logic(self, manager_with_sample_tasks):
         """Test filtering with multiple criteria uses AND logic."""
@@ -1,7 +1,8 @@
 """Unit tests for Task model."""
 
+import pytest
 from datetime import datetime
-from src.models.task import Task
+from src.models.task import PRIORITY_RANK, Task
 
 
 def test_task_creation_with_all_fields():
@@ -33,29 +34,23 @@ def test_task_completion_status_can_be_set():
 
 # Phase-2 Tests
 
-def test_task_with_priority():
-    """Test task creation with priority field."""
-    task = Task(id=1, title="Test", priority="high")
-    assert task.priority == "high"
-
-
-def test_task_with_category():
-    """Test task creation with category field."""
-    task = Task(id=1, title="Test", category="Work")
-    assert task.category == "Work"
-
-
-def test_task_with_due_date():
-    """Test task creation with due date."""
-    due = datetime(2026, 1, 15, 12, 0)
-    task = Task(id=1, title="Test", due_date=due)
-    assert task.due_date == due
-
-
-def test_task_with_recurrence_rule():
-    """Test task creation with recurrence rule."""
-    task = Task(id=1, title="Test", recurrence_rule="daily")
-    assert task.recurrence_rule == "daily"
+@pytest.mark.parametrize("field, value", [
+    ("priority", "high"),
+    ("category", "Work"),
+    ("due_date", datetime(2026, 1, 15, 12, 0)),
+    ("recurrence_rule", "daily"),
+])
+def test_task_optional_field(field, value):
+    """Test task creation with each optional Phase-2 field."""
+    task = Task(id=1, title="Test", **{field: value})
+    assert getattr(task, field) == value
+
+
+@pytest.mark.parametrize("priority", ["high", "medium", "low", None])
+def test_task_caches_priority_rank(priority):
+    """Test that the integer sort rank is cached at construction time."""
+    task = Task(id=1, title="Test", priority=priority)
+    assert task._priority_rank == PRIORITY_RANK[priority]
 
 
 def test_task_defaults_for_phase2_fields():
@@ -11,29 +11,58 @@ Usage:
 """
 
 import argparse
-import requests
-import json
-from typing import Dict, Optional
+import io
+import sys
+import httpx
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, TextIO
+
+def _json(response: httpx.Response) -> Dict:
+    """Decode a JSON response body with orjson (C parser, bytes in)."""
+    return orjson.loads(response.content)
+
+# HTTP/2 needs the h2 extra (pip install 'httpx[http2]'); probe for it so a
+# plain httpx install still works, just without multiplexing
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
 
 class AuthTester:
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, out: Optional[TextIO] = None):
         self.base_url = base_url.rstrip('/')
-        self.session = requests.Session()
+        # One keep-alive connection per suite; with an HTTP/2-capable server
+        # (behind Nginx/Caddy) the requests multiplex over a single TCP+TLS
+        # connection and HPACK compresses the repeated Cookie headers.
+        # Falls back to HTTP/1.1 keep-alive when the h2 extra is missing
+        self.session = httpx.Client(
+            transport=httpx.HTTPTransport(
+                http2=_HTTP2_AVAILABLE,
+                retries=0,
+                limits=httpx.Limits(max_connections=20),
+            ),
+        )
+        self.session.headers["Content-Type"] = "application/json"
         self.cookies: Dict[str, str] = {}
+        # Suite output stream; parallel runs pass a buffer so logs from
+        # concurrent users do not interleave on stdout
+        self.out = out or sys.stdout
 
     def test_health(self) -> bool:
         """Test health check endpoint"""
         try:
             response = self.session.get(f"{self.base_url}/health")
             if response.status_code == 200:
-                data = response.json()
-                print(f"✅ Health check passed: {data}")
+                data = _json(response)
+                print(f"✅ Health check passed: {data}", file=self.out)
                 return True
             else:
-                print(f"❌ Health check failed: {response.status_code}")
+                print(f"❌ Health check failed: {response.status_code}", file=self.out)
                 return False
         except Exception as e:
-            print(f"❌ Health check error: {e}")
+            print(f"❌ Health check error: {e}", file=self.out)
             return False
 
     def test_signup(self, email: str, password: str, name: str, custom_data: Optional[Dict] = None) -> bool:
@@ -51,24 +80,23 @@ class AuthTester:
             response = self.session.post(
                 f"{self.base_url}/api/auth/sign-up/email",
                 json=payload,
-                headers={"Content-Type": "application/json"}
             )
 
             if response.status_code == 200 or response.status_code == 201:
-                data = response.json()
-                print(f"✅ Signup successful")
-                print(f"   User ID: {data.get('user', {}).get('id', 'N/A')}")
-                print(f"   Email: {data.get('user', {}).get('email', 'N/A')}")
+                data = _json(response)
+                print(f"✅ Signup successful", file=self.out)
+                print(f"   User ID: {data.get('user', {}).get('id', 'N/A')}", file=self.out)
+                print(f"   Email: {data.get('user', {}).get('email', 'N/A')}", file=self.out)
 
                 # Save cookies for subsequent requests
                 self.cookies = dict(response.cookies)
                 return True
             else:
-                print(f"❌ Signup failed: {response.status_code}")
-                print(f"   Response: {response.text}")
+                print(f"❌ Signup failed: {response.status_code}", file=self.out)
+                print(f"   Response: {response.text}", file=self.out)
                 return False
         except Exception as e:
-            print(f"❌ Signup error: {e}")
+            print(f"❌ Signup error: {e}", file=self.out)
             return False
 
     def test_signin(self, email: str, password: str) -> bool:
@@ -82,24 +110,23 @@ class AuthTester:
             response = self.session.post(
                 f"{self.base_url}/api/auth/sign-in/email",
                 json=payload,
-                headers={"Content-Type": "application/json"}
             )
 
             if response.status_code == 200:
-                data = response.json()
-                print(f"✅ Signin successful")
-                print(f"   User ID: {data.get('user', {}).get('id', 'N/A')}")
-                print(f"   Email: {data.get('user', {}).get('email', 'N/A')}")
+                data = _json(response)
+                print(f"✅ Signin successful", file=self.out)
+                print(f"   User ID: {data.get('user', {}).get('id', 'N/A')}", file=self.out)
+                print(f"   Email: {data.get('user', {}).get('email', 'N/A')}", file=self.out)
 
                 # Save cookies
                 self.cookies = dict(response.cookies)
                 return True
             else:
-                print(f"❌ Signin failed: {response.status_code}")
-                print(f"   Response: {response.text}")
+                print(f"❌ Signin failed: {response.status_code}", file=self.out)
+                print(f"   Response: {response.text}", file=self.out)
                 return False
         except Exception as e:
-            print(f"❌ Signin error: {e}")
+            print(f"❌ Signin error: {e}", file=self.out)
             return False
 
     def test_get_session(self) -> bool:
@@ -111,16 +138,16 @@ class AuthTester:
             )
 
             if response.status_code == 200:
-                data = response.json()
-                print(f"✅ Session retrieved")
-                print(f"   User: {data.get('user', {}).get('email', 'N/A')}")
-                print(f"   Session ID: {data.get('session', {}).get('id', 'N/A')}")
+                data = _json(response)
+                print(f"✅ Session retrieved", file=self.out)
+                print(f"   User: {data.get('user', {}).get('email', 'N/A')}", file=self.out)
+                print(f"   Session ID: {data.get('session', {}).get('id', 'N/A')}", file=self.out)
                 return True
             else:
-                print(f"❌ Get session failed: {response.status_code}")
+                print(f"❌ Get session failed: {response.status_code}", file=self.out)
                 return False
         except Exception as e:
-            print(f"❌ Get session error: {e}")
+            print(f"❌ Get session error: {e}", file=self.out)
             return False
 
     def test_jwt_generation(self) -> Optional[str]:
@@ -132,17 +159,17 @@ class AuthTester:
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = _json(response)
                 token = data.get('token')
-                print(f"✅ JWT generated successfully")
-                print(f"   Token: {token[:50]}...")
+                print(f"✅ JWT generated successfully", file=self.out)
+                print(f"   Token: {token[:50]}...", file=self.out)
                 return token
             else:
-                print(f"❌ JWT generation failed: {response.status_code}")
-                print(f"   Response: {response.text}")
+                print(f"❌ JWT generation failed: {response.status_code}", file=self.out)
+                print(f"   Response: {response.text}", file=self.out)
                 return None
         except Exception as e:
-            print(f"❌ JWT generation error: {e}")
+            print(f"❌ JWT generation error: {e}", file=self.out)
             return None
 
     def test_signout(self) -> bool:
@@ -154,16 +181,49 @@ class AuthTester:
             )
 
             if response.status_code == 200:
-                print(f"✅ Signout successful")
+                print(f"✅ Signout successful", file=self.out)
                 self.cookies = {}
                 return True
             else:
-                print(f"❌ Signout failed: {response.status_code}")
+                print(f"❌ Signout failed: {response.status_code}", file=self.out)
                 return False
         except Exception as e:
-            print(f"❌ Signout error: {e}")
+            print(f"❌ Signout error: {e}", file=self.out)
             return False
 
+    def run_suite(self, email: str, password: str, name: str, custom_data: Optional[Dict] = None) -> None:
+        """Run the full sequential test flow for one user."""
+        out = self.out
+
+        print("\n1. Testing health endpoint...", file=out)
+        if not self.test_health():
+            print("\n❌ Health check failed. Is the server running?", file=out)
+            return
+
+        print("\n2. Testing signup...", file=out)
+        if not self.test_signup(email, password, name, custom_data):
+            print("\n⚠️  Signup failed (user might already exist). Trying signin...", file=out)
+            print("\n3. Testing signin...", file=out)
+            if not self.test_signin(email, password):
+                print("\n❌ Both signup and signin failed. Stopping tests.", file=out)
+                return
+        else:
+            print("\n   Note: Signup auto-signs in, skipping separate signin test", file=out)
+
+        print("\n4. Testing session retrieval...", file=out)
+        self.test_get_session()
+
+        print("\n5. Testing JWT generation...", file=out)
+        self.test_jwt_generation()
+
+        print("\n6. Testing signout...", file=out)
+        self.test_signout()
+
+def _tagged_email(email: str, tag: int) -> str:
+    """Derive a unique per-user address via plus-addressing (a+1@b.com)."""
+    local, _, domain = email.partition('@')
+    return f"{local}+{tag}@{domain}"
+
 def main():
     parser = argparse.ArgumentParser(description="Test Better-Auth endpoints")
     parser.add_argument("--base-url", default="http://localhost:3001", help="Base URL of auth service")
@@ -171,6 +231,8 @@ def main():
     parser.add_argument("--password", default="TestPassword123!", help="Test password")
     parser.add_argument("--name", default="Test User", help="Test user name")
     parser.add_argument("--custom-fields", default="", help="Custom fields as JSON")
+    parser.add_argument("--parallel-users", type=int, default=1,
+                        help="Run N user suites concurrently with plus-addressed emails (default: 1)")
 
     args = parser.parse_args()
 
@@ -178,40 +240,33 @@ def main():
     custom_data = None
     if args.custom_fields:
         try:
-            custom_data = json.loads(args.custom_fields)
-        except json.JSONDecodeError:
+            custom_data = orjson.loads(args.custom_fields)
+        except orjson.JSONDecodeError:
             print("❌ Invalid JSON for custom fields")
             return
 
-    tester = AuthTester(args.base_url)
-
     print(f"🧪 Testing Better-Auth at {args.base_url}\n")
     print("=" * 60)
 
-    # Run tests
-    print("\n1. Testing health endpoint...")
-    if not tester.test_health():
-        print("\n❌ Health check failed. Is the server running?")
-        return
-
-    print("\n2. Testing signup...")
-    if not tester.test_signup(args.email, args.password, args.name, custom_data):
-        print("\n⚠️  Signup failed (user might already exist). Trying signin...")
-        print("\n3. Testing signin...")
-        if not tester.test_signin(args.email, args.password):
-            print("\n❌ Both signup and signin failed. Stopping tests.")
-            return
+    if args.parallel_users <= 1:
+        AuthTester(args.base_url).run_suite(args.email, args.password, args.name, custom_data)
     else:
-        print("\n   Note: Signup auto-signs in, skipping separate signin test")
-
-    print("\n4. Testing session retrieval...")
-    tester.test_get_session()
-
-    print("\n5. Testing JWT generation...")
-    tester.test_jwt_generation()
-
-    print("\n6. Testing signout...")
-    tester.test_signout()
+        # Each user's flow stays sequential (signup must precede session
+        # checks), but independent users overlap their network round trips
+        # on a thread pool; httpx releases the GIL while waiting on I/O
+        buffers = [io.StringIO() for _ in range(args.parallel_users)]
+        with ThreadPoolExecutor(max_workers=args.parallel_users) as pool:
+            futures = [
+                pool.submit(
+                    AuthTester(args.base_url, out=buf).run_suite,
+                    _tagged_email(args.email, i), args.password, f"{args.name} {i}", custom_data,
+                )
+                for i, buf in enumerate(buffers)
+            ]
+            for i, (future, buf) in enumerate(zip(futures, buffers)):
+                future.result()
+                print(f"\n--- User {i} ({_tagged_email(args.email, i)}) ---")
+                print(buf.getvalue(), end="")
 
     print("\n" + "=" * 60)
     print("✅ All tests completed!")
@@ -20,22 +20,43 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Change tasks.user_id from integer to varchar."""
-    # SQLAlchemy with postgres will handle the type cast
+    # Drop the dependent index first so the ALTER is a single in-place pass;
+    # the explicit USING cast keeps it from failing on populated tables
+    op.drop_index('ix_tasks_user_id', table_name='tasks')
     op.alter_column(
         'tasks',
         'user_id',
         type_=sa.String(length=255),
         existing_type=sa.Integer(),
-        existing_nullable=False
+        existing_nullable=False,
+        postgresql_using='user_id::varchar'
     )
+    # Rebuild the index without an exclusive table lock; CONCURRENTLY must
+    # run outside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_user_id',
+            'tasks',
+            ['user_id'],
+            postgresql_concurrently=True
+        )
 
 
 def downgrade() -> None:
     """Revert tasks.user_id from varchar to integer."""
+    op.drop_index('ix_tasks_user_id', table_name='tasks')
     op.alter_column(
         'tasks',
         'user_id',
         type_=sa.Integer(),
         existing_type=sa.String(length=255),
-        existing_nullable=False
+        existing_nullable=False,
+        postgresql_using='user_id::integer'
     )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_user_id',
+            'tasks',
+            ['user_id'],
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,43 @@
+"""Add covering index for the task summary aggregates
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-08-31
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create a composite index on tasks(user_id, completed, due_date)."""
+    # Covers every COUNT(*) FILTER branch of the summary query so Postgres
+    # can answer it with index-only scans; CONCURRENTLY avoids holding an
+    # exclusive lock while the index builds, so it must run outside the
+    # migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_tasks_user_completed_due',
+            'tasks',
+            ['user_id', 'completed', 'due_date'],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    """Drop the summary covering index."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_tasks_user_completed_due',
+            table_name='tasks',
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,54 @@
+"""Store timestamps as timezone-aware timestamptz
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-08-31
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Existing naive values were always written as UTC, so the conversion just
+# attaches that zone
+_COLUMNS = (
+    ('tasks', 'due_date', True),
+    ('tasks', 'created_at', False),
+    ('tasks', 'updated_at', False),
+    ('users', 'created_at', False),
+    ('users', 'updated_at', False),
+)
+
+
+def upgrade() -> None:
+    """Convert timestamp columns to timestamptz, interpreting values as UTC."""
+    for table, column, nullable in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(timezone=True),
+            existing_type=sa.DateTime(),
+            existing_nullable=nullable,
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'"
+        )
+
+
+def downgrade() -> None:
+    """Revert timestamptz columns back to naive UTC timestamps."""
+    for table, column, nullable in _COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.DateTime(),
+            existing_type=sa.DateTime(timezone=True),
+            existing_nullable=nullable,
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'"
+        )
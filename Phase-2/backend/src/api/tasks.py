@@ -1,16 +1,22 @@
 """Task API endpoints."""
+from datetime import datetime, timedelta, timezone
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.auth.dependencies import get_current_user
-from src.database import get_session
+from src.database import get_readonly_session, get_session
 from src.schemas.task import TaskCreate, TaskResponse, TaskUpdate
 from src.services import task_service
 
 router = APIRouter()
 
+# Built once at import: validates a whole task list in a single
+# pydantic-core call instead of a Python-level model_validate loop
+_TASK_LIST_ADAPTER = TypeAdapter(list[TaskResponse])
+
 
 @router.post("/tasks", response_model=TaskResponse, status_code=status.HTTP_201_CREATED)
 async def create_task(
@@ -35,25 +41,30 @@ async def create_task(
 @router.get("/tasks", response_model=list[TaskResponse])
 async def get_tasks(
     user_id: Annotated[str, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_session)],
+    db: Annotated[AsyncSession, Depends(get_readonly_session)],
+    limit: Annotated[int, Query(ge=1, le=500)] = 100,
+    cursor: int | None = None,
 ) -> list[TaskResponse]:
-    """Get all tasks for the authenticated user.
+    """Get tasks for the authenticated user, newest first.
 
     Args:
         user_id: Authenticated user ID from JWT
         db: Database session
+        limit: Maximum number of tasks per page
+        cursor: id of the last task from the previous page; omit for the
+            first page
 
     Returns:
-        List of user's tasks
+        Page of the user's tasks
     """
-    tasks = await task_service.get_user_tasks(db, user_id)
-    return [TaskResponse.model_validate(task) for task in tasks]
+    tasks = await task_service.get_user_tasks(db, user_id, limit=limit, cursor=cursor)
+    return _TASK_LIST_ADAPTER.validate_python(tasks, from_attributes=True)
 
 
 @router.get("/tasks/summary")
 async def get_tasks_summary(
     user_id: Annotated[str, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_session)],
+    db: Annotated[AsyncSession, Depends(get_readonly_session)],
 ) -> dict:
     """Get task summary with counts.
 
@@ -64,42 +75,25 @@ async def get_tasks_summary(
     Returns:
         Dictionary with task counts: total, pending, completed, overdue, due_today, due_tomorrow
     """
-    tasks = await task_service.get_user_tasks(db, user_id)
-    task_responses = [TaskResponse.model_validate(task) for task in tasks]
-
-    total = len(task_responses)
-    pending = sum(1 for t in task_responses if not t.completed)
-    completed = sum(1 for t in task_responses if t.completed)
-    overdue = sum(1 for t in task_responses if t.is_overdue)
-    due_today = sum(1 for t in task_responses if t.is_due_today)
-
-    # Calculate due_tomorrow
-    from datetime import datetime, timedelta, timezone
-    tomorrow = (datetime.now(timezone.utc) + timedelta(days=1)).date()
-    due_tomorrow = sum(
-        1
-        for t in task_responses
-        if t.due_date
-        and not t.completed
-        and (t.due_date.replace(tzinfo=timezone.utc) if t.due_date.tzinfo is None else t.due_date).date()
-        == tomorrow
+    # All counts come back from one aggregate query, so nothing is
+    # materialized or validated in Python
+    now = datetime.now(timezone.utc)
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    return await task_service.get_user_tasks_summary(
+        db,
+        user_id,
+        now=now,
+        today_start=today_start,
+        tomorrow_start=today_start + timedelta(days=1),
+        day_after_start=today_start + timedelta(days=2),
     )
 
-    return {
-        "total": total,
-        "pending": pending,
-        "completed": completed,
-        "overdue": overdue,
-        "due_today": due_today,
-        "due_tomorrow": due_tomorrow,
-    }
-
 
 @router.get("/tasks/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: int,
     user_id: Annotated[str, Depends(get_current_user)],
-    db: Annotated[AsyncSession, Depends(get_session)],
+    db: Annotated[AsyncSession, Depends(get_readonly_session)],
 ) -> TaskResponse:
     """Get a specific task by ID.
 
@@ -1,22 +1,26 @@
 """FastAPI dependencies for authentication."""
-from typing import Annotated
+import logging
 
-from fastapi import Depends, HTTPException, status
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from fastapi import HTTPException, Request, status
 
 from src.auth.jwt import verify_token
 
-# HTTPBearer security scheme
-security = HTTPBearer()
+logger = logging.getLogger(__name__)
 
+# Possible user ID claim names from Better-Auth, most likely first
+_USER_ID_FIELDS = ("userId", "user_id", "sub", "id")
 
-async def get_current_user(
-    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)]
-) -> str:
+
+async def get_current_user(request: Request) -> str:
     """Get current authenticated user ID from JWT token.
 
+    Parses the Authorization header inline rather than going through
+    HTTPBearer, so dependency resolution stays on the event loop with no
+    thread-pool hop. Missing or malformed credentials yield 401 with a
+    WWW-Authenticate challenge, matching the integration tests.
+
     Args:
-        credentials: HTTP Bearer token credentials
+        request: Incoming request carrying the Authorization header
 
     Returns:
         User ID from token
@@ -24,7 +28,21 @@ async def get_current_user(
     Raises:
         HTTPException: If token is invalid or missing user_id
     """
-    token = credentials.credentials
+    authorization = request.headers.get("authorization")
+    if not authorization:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
     payload = verify_token(token)
 
     if payload is None:
@@ -34,18 +52,17 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Try different possible user ID field names from Better-Auth
+    # Single .get() probe per candidate claim; the tuple is a module constant
     user_id: str | None = None
-    for field in ["userId", "user_id", "sub", "id"]:
-        if field in payload:
-            user_id = payload[field]
+    for field in _USER_ID_FIELDS:
+        value = payload.get(field)
+        if value is not None:
             # Ensure it's a string
-            if not isinstance(user_id, str):
-                user_id = str(user_id)
+            user_id = value if isinstance(value, str) else str(value)
             break
 
     if user_id is None:
-        print(f"[DEBUG] No user ID found in token payload. Available fields: {list(payload.keys())}")
+        logger.debug("No user ID found in token payload. Available fields: %s", list(payload))
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token payload - missing user ID",
@@ -1,10 +1,25 @@
 """JWT token creation and verification."""
-from datetime import datetime, timedelta
+import logging
+import threading
+from datetime import datetime, timezone
 from typing import Any
 
-from jose import JWTError, jwt
+import jwt
+from cachetools import TTLCache
 
-from src.config import settings
+from src.config import JWT_ALGORITHM, JWT_EXPIRE_DELTA, JWT_SECRET
+
+logger = logging.getLogger(__name__)
+
+# Accepted-algorithms list built once for decode
+_JWT_ALGORITHMS = [JWT_ALGORITHM]
+
+# Decoded payloads keyed by the raw token string. Tokens are immutable until
+# expiry, so a short TTL turns repeat verifications of a hot token into a
+# dict lookup instead of an HMAC check; the TTL bounds how far past its exp
+# a cached token can still validate (at most 30 s)
+_decode_cache: TTLCache = TTLCache(maxsize=4096, ttl=30)
+_decode_cache_lock = threading.Lock()
 
 
 def create_access_token(data: dict[str, Any]) -> str:
@@ -17,14 +32,8 @@ def create_access_token(data: dict[str, Any]) -> str:
         Encoded JWT token string
     """
     to_encode = data.copy()
-    expire = datetime.utcnow() + timedelta(
-        minutes=settings.jwt_access_token_expire_minutes
-    )
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.jwt_secret, algorithm=settings.jwt_algorithm
-    )
-    return encoded_jwt
+    to_encode["exp"] = datetime.now(timezone.utc) + JWT_EXPIRE_DELTA
+    return jwt.encode(to_encode, JWT_SECRET, algorithm=JWT_ALGORITHM)
 
 
 def verify_token(token: str) -> dict[str, Any] | None:
@@ -36,13 +45,19 @@ def verify_token(token: str) -> dict[str, Any] | None:
     Returns:
         Decoded token payload if valid, None otherwise
     """
+    with _decode_cache_lock:
+        cached = _decode_cache.get(token)
+    if cached is not None:
+        return cached
+
     try:
-        payload = jwt.decode(
-            token, settings.jwt_secret, algorithms=[settings.jwt_algorithm]
-        )
-        print(f"[DEBUG] Token verified successfully. Payload: {payload}")
+        payload = jwt.decode(token, JWT_SECRET, algorithms=_JWT_ALGORITHMS)
+        # %s formatting is deferred, so the payload is only serialized when
+        # a handler at DEBUG level is attached
+        logger.debug("Token verified successfully. Payload: %s", payload)
+        with _decode_cache_lock:
+            _decode_cache[token] = payload
         return payload
-    except JWTError as e:
-        print(f"[DEBUG] Token verification failed: {e}")
-        print(f"[DEBUG] Token (first 50 chars): {token[:50]}...")
+    except jwt.InvalidTokenError as e:
+        logger.debug("Token verification failed: %s (token prefix: %.50s)", e, token)
         return None
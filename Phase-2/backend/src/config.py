@@ -1,5 +1,6 @@
 """Application configuration settings."""
 import os
+from datetime import timedelta
 from typing import Literal
 
 from pydantic_settings import BaseSettings
@@ -42,3 +43,10 @@ class Settings(BaseSettings):
 
 # Global settings instance
 settings = Settings()
+
+# JWT hot-path constants resolved once at import: plain module attributes
+# skip Pydantic descriptor dispatch on every token operation, and the
+# expiry timedelta is built a single time
+JWT_SECRET = settings.jwt_secret
+JWT_ALGORITHM = settings.jwt_algorithm
+JWT_EXPIRE_DELTA = timedelta(minutes=settings.jwt_access_token_expire_minutes)
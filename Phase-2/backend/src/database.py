@@ -1,4 +1,5 @@
 """Database connection and session management."""
+import logging
 from typing import AsyncGenerator
 from urllib.parse import urlparse, urlunparse
 
@@ -30,11 +31,26 @@ connect_args = {}
 if 'sslmode=require' in settings.database_url:
     connect_args['ssl'] = 'require'
 
+# SQL logging goes through the sqlalchemy.engine logger instead of echo:
+# the logger defers statement/parameter formatting until a handler at the
+# level is attached, while echo stringifies every query unconditionally
+logging.getLogger("sqlalchemy.engine").setLevel(
+    logging.INFO if settings.environment == "development" else logging.WARNING
+)
+
 engine = create_async_engine(
     clean_url,
-    echo=settings.environment == "development",
+    echo=False,
     future=True,
     connect_args=connect_args,
+    # Every endpoint awaits a session, so the default pool of 5 caps
+    # concurrency; pre_ping and recycle guard against Neon closing idle
+    # connections server-side
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=10,
+    pool_pre_ping=True,
+    pool_recycle=1800,
 )
 
 # Create async session maker
@@ -44,6 +60,16 @@ async_session_maker = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Read-only sessions run on an AUTOCOMMIT view of the same engine (shared
+# pool): no BEGIN/ROLLBACK round trips bracket the single SELECT that GET
+# endpoints issue
+readonly_session_maker = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False,
+)
+
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Get database session dependency for FastAPI."""
@@ -51,6 +77,12 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
+async def get_readonly_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get a transaction-free database session for read-only endpoints."""
+    async with readonly_session_maker() as session:
+        yield session
+
+
 async def create_db_and_tables():
     """Create all database tables."""
     async with engine.begin() as conn:
@@ -1,8 +1,9 @@
 """Task database model."""
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 
+from sqlalchemy import DateTime, Index
 from sqlmodel import Field, SQLModel
 
 
@@ -27,6 +28,11 @@ class Task(SQLModel, table=True):
     """Task model for todo items."""
 
     __tablename__ = "tasks"
+    # Composite index lets the summary's COUNT(*) FILTER aggregates run as
+    # index-only scans instead of scanning every row for the user
+    __table_args__ = (
+        Index("ix_tasks_user_completed_due", "user_id", "completed", "due_date"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: str = Field(index=True, max_length=255)  # Better-Auth uses string IDs
@@ -35,7 +41,15 @@ class Task(SQLModel, table=True):
     completed: bool = Field(default=False)
     priority: Priority = Field(default=Priority.MEDIUM)
     category: Optional[str] = Field(default=None, max_length=100)
-    due_date: Optional[datetime] = Field(default=None)
+    # Timestamps are stored timezone-aware (timestamptz) so consumers never
+    # have to guess and re-attach UTC
+    due_date: Optional[datetime] = Field(default=None, sa_type=DateTime(timezone=True))
     recurrence: Recurrence = Field(default=Recurrence.NONE)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_type=DateTime(timezone=True),
+    )
+    updated_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_type=DateTime(timezone=True),
+    )
@@ -1,8 +1,9 @@
 """Task Pydantic schemas for API."""
 from datetime import datetime, timezone
+from functools import cached_property
 from typing import Optional
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 from src.models.task import Priority, Recurrence
 
@@ -10,6 +11,10 @@ from src.models.task import Priority, Recurrence
 class TaskCreate(BaseModel):
     """Schema for creating a new task."""
 
+    # Build the pydantic-core validator at class creation instead of lazily
+    # on the first request
+    model_config = ConfigDict(defer_build=False)
+
     title: str = Field(..., min_length=1, max_length=255)
     description: Optional[str] = None
     priority: Priority = Priority.MEDIUM
@@ -21,6 +26,8 @@ class TaskCreate(BaseModel):
 class TaskUpdate(BaseModel):
     """Schema for updating an existing task."""
 
+    model_config = ConfigDict(defer_build=False)
+
     title: Optional[str] = Field(None, min_length=1, max_length=255)
     description: Optional[str] = None
     completed: Optional[bool] = None
@@ -33,6 +40,8 @@ class TaskUpdate(BaseModel):
 class TaskResponse(BaseModel):
     """T100: Schema for task API responses with computed overdue/due_today fields."""
 
+    model_config = ConfigDict(from_attributes=True, defer_build=False)
+
     id: int
     user_id: str
     title: str
@@ -45,33 +54,21 @@ class TaskResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
+    # cached_property: each flag is computed at most once per instance, so
+    # repeated access during serialization does not re-read the clock
     @computed_field  # type: ignore[misc]
-    @property
+    @cached_property
     def is_overdue(self) -> bool:
         """Check if task is overdue."""
         if not self.due_date or self.completed:
             return False
-        now = datetime.now(timezone.utc)
-        # Make due_date timezone-aware if it isn't
-        due = self.due_date
-        if due.tzinfo is None:
-            due = due.replace(tzinfo=timezone.utc)
-        return due < now
+        # due_date is stored timezone-aware, so no tzinfo fixup is needed
+        return self.due_date < datetime.now(timezone.utc)
 
     @computed_field  # type: ignore[misc]
-    @property
+    @cached_property
     def is_due_today(self) -> bool:
         """Check if task is due today."""
         if not self.due_date or self.completed:
             return False
-        now = datetime.now(timezone.utc)
-        # Make due_date timezone-aware if it isn't
-        due = self.due_date
-        if due.tzinfo is None:
-            due = due.replace(tzinfo=timezone.utc)
-        return due.date() == now.date()
-
-    class Config:
-        """Pydantic config."""
-
-        from_attributes = True
+        return self.due_date.date() == datetime.now(timezone.utc).date()
@@ -45,6 +45,9 @@ async def create_recurring_instance(
 ) -> Optional[Task]:
     """T098: Create a new instance of a recurring task.
 
+    The new instance is only added to the session; the caller owns the
+    commit, so the toggle and the new instance land in one transaction.
+
     Args:
         db: Database session
         original_task: The completed recurring task to duplicate
@@ -75,6 +78,4 @@ async def create_recurring_instance(
     )
 
     db.add(new_task)
-    await db.commit()
-    await db.refresh(new_task)
     return new_task
@@ -2,6 +2,7 @@
 from datetime import datetime, timezone
 from typing import Sequence
 
+from sqlalchemy import and_, delete, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -38,20 +39,89 @@ async def create_task(
     return task
 
 
-async def get_user_tasks(db: AsyncSession, user_id: str) -> Sequence[Task]:
-    """Get all tasks for a user.
+async def get_user_tasks(
+    db: AsyncSession, user_id: str, limit: int = 100, cursor: int | None = None
+) -> Sequence[Task]:
+    """Get a page of tasks for a user, newest first.
+
+    Uses keyset pagination on the id (which follows creation order): each
+    page seeks directly to ids below the cursor instead of scanning and
+    discarding OFFSET rows, so memory and work per page stay bounded.
+
+    Args:
+        db: Database session
+        user_id: ID of the user
+        limit: Maximum number of tasks to return
+        cursor: Return tasks with ids below this value (last id of the
+            previous page); None fetches the first page
+
+    Returns:
+        Page of the user's tasks
+    """
+    stmt = select(Task).where(Task.user_id == user_id)
+    if cursor is not None:
+        stmt = stmt.where(Task.id < cursor)
+    result = await db.execute(stmt.order_by(Task.id.desc()).limit(limit))
+    return result.scalars().all()
+
+
+async def get_user_tasks_summary(
+    db: AsyncSession,
+    user_id: str,
+    *,
+    now: datetime,
+    today_start: datetime,
+    tomorrow_start: datetime,
+    day_after_start: datetime,
+) -> dict[str, int]:
+    """Get task counts for a user in a single aggregate query.
+
+    All six counters are computed server-side with COUNT(*) FILTER, so no
+    task rows are materialized in Python regardless of how many tasks the
+    user has.
 
     Args:
         db: Database session
         user_id: ID of the user
+        now: Current time (aware UTC)
+        today_start: Midnight today (aware UTC)
+        tomorrow_start: Midnight tomorrow (aware UTC)
+        day_after_start: Midnight the day after tomorrow (aware UTC)
 
     Returns:
-        List of user's tasks
+        Dictionary with total, pending, completed, overdue, due_today and
+        due_tomorrow counts
     """
+    not_done = Task.completed.is_(False)
     result = await db.execute(
-        select(Task).where(Task.user_id == user_id).order_by(Task.created_at.desc())
+        select(
+            func.count().label("total"),
+            func.count().filter(not_done).label("pending"),
+            func.count().filter(Task.completed.is_(True)).label("completed"),
+            func.count()
+            .filter(and_(not_done, Task.due_date < now))
+            .label("overdue"),
+            func.count()
+            .filter(
+                and_(
+                    not_done,
+                    Task.due_date >= today_start,
+                    Task.due_date < tomorrow_start,
+                )
+            )
+            .label("due_today"),
+            func.count()
+            .filter(
+                and_(
+                    not_done,
+                    Task.due_date >= tomorrow_start,
+                    Task.due_date < day_after_start,
+                )
+            )
+            .label("due_tomorrow"),
+        ).where(Task.user_id == user_id)
     )
-    return result.scalars().all()
+    return dict(result.one()._mapping)
 
 
 async def get_task_by_id(
@@ -87,19 +157,18 @@ async def update_task(
     Returns:
         Updated task if found and owned by user, None otherwise
     """
-    task = await get_task_by_id(db, task_id, user_id)
-    if not task:
-        return None
-
-    # Update only provided fields
+    # Update only provided fields; a single UPDATE ... RETURNING replaces
+    # the select/mutate/commit/refresh sequence, and the WHERE clause doubles
+    # as the ownership check
     update_data = task_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(task, field, value)
-
-    task.updated_at = datetime.utcnow()
-    db.add(task)
+    result = await db.execute(
+        update(Task)
+        .where(Task.id == task_id, Task.user_id == user_id)
+        .values(**update_data, updated_at=datetime.now(timezone.utc))
+        .returning(Task)
+    )
+    task = result.scalar_one_or_none()
     await db.commit()
-    await db.refresh(task)
     return task
 
 
@@ -114,13 +183,14 @@ async def delete_task(db: AsyncSession, task_id: int, user_id: str) -> bool:
     Returns:
         True if task was deleted, False if not found or not owned by user
     """
-    task = await get_task_by_id(db, task_id, user_id)
-    if not task:
-        return False
-
-    await db.delete(task)
+    result = await db.execute(
+        delete(Task)
+        .where(Task.id == task_id, Task.user_id == user_id)
+        .returning(Task.id)
+    )
+    deleted_id = result.scalar_one_or_none()
     await db.commit()
-    return True
+    return deleted_id is not None
 
 
 async def toggle_task_complete(
@@ -137,18 +207,22 @@ async def toggle_task_complete(
     Returns:
         Updated task if found and owned by user, None otherwise
     """
-    task = await get_task_by_id(db, task_id, user_id)
+    result = await db.execute(
+        update(Task)
+        .where(Task.id == task_id, Task.user_id == user_id)
+        .values(completed=completed, updated_at=datetime.now(timezone.utc))
+        .returning(Task)
+    )
+    task = result.scalar_one_or_none()
     if not task:
+        await db.commit()
         return None
 
-    task.completed = completed
-    task.updated_at = datetime.utcnow()
-    db.add(task)
-    await db.commit()
-    await db.refresh(task)
-
-    # T099: Create recurring instance when marking recurring task as complete
+    # T099: Create recurring instance when marking recurring task as
+    # complete; it is added to the same transaction so the toggle and the
+    # new instance land with one commit
     if completed and task.recurrence and task.due_date:
         await recurrence_service.create_recurring_instance(db, task)
+    await db.commit()
 
     return task
@@ -5,11 +5,12 @@ from typing import AsyncGenerator, Generator
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy.pool import StaticPool
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel
 
 from src.auth.jwt import create_access_token
-from src.database import get_session
+from src.database import get_readonly_session, get_session
 from src.main import app
 from src.models.task import Task
 from src.models.user import User
@@ -17,6 +18,10 @@ from src.models.user import User
 # Test database URL (use in-memory SQLite for fast tests)
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
+# "password123" hashed with bcrypt, computed once offline: no test ever
+# needs to pay the ~100 ms bcrypt cost, and both seed users share it
+PASSWORD_HASH = "$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewY5GyYqKvZ.KCqC"
+
 
 @pytest.fixture(scope="session")
 def event_loop() -> Generator:
@@ -26,13 +31,18 @@ def event_loop() -> Generator:
     loop.close()
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session")
 async def engine():
-    """Create test database engine."""
+    """Create the test database engine and schema once per session."""
+    # StaticPool keeps one shared connection, so every session and the
+    # seeded users see the same in-memory database instead of each new
+    # connection getting its own empty one
     test_engine = create_async_engine(
         TEST_DATABASE_URL,
         echo=False,
         future=True,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
     )
 
     async with test_engine.begin() as conn:
@@ -45,105 +55,136 @@ async def engine():
 
 @pytest_asyncio.fixture
 async def db_session(engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create test database session."""
-    async_session_maker = async_sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-
-    async with async_session_maker() as session:
-        yield session
-
-
-@pytest_asyncio.fixture
-async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
-    """Create test HTTP client."""
-    async def override_get_session():
-        yield db_session
-
-    app.dependency_overrides[get_session] = override_get_session
-
+    """Create a test session isolated by an outer rolled-back transaction.
+
+    The session joins a connection-level transaction in create_savepoint
+    mode, so commits inside the application only release SAVEPOINTs; the
+    outer rollback discards everything the test wrote without touching the
+    session-scoped schema or seed rows.
+    """
+    async with engine.connect() as conn:
+        outer = await conn.begin()
+        session_maker = async_sessionmaker(
+            conn,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+
+        async with session_maker() as session:
+            yield session
+
+        await outer.rollback()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client() -> AsyncGenerator[AsyncClient, None]:
+    """Create one test HTTP client for the whole session.
+
+    The ASGI transport and client are built once; per-test state lives in
+    the dependency overrides installed by the autouse fixture below.
+    """
     async with AsyncClient(
         transport=ASGITransport(app=app),
         base_url="http://test"
     ) as test_client:
         yield test_client
 
+
+@pytest.fixture(autouse=True)
+def _override_db_dependencies(db_session: AsyncSession) -> Generator:
+    """Point the app's session dependencies at the current test session."""
+    async def override_get_session():
+        yield db_session
+
+    app.dependency_overrides[get_session] = override_get_session
+    app.dependency_overrides[get_readonly_session] = override_get_session
+    yield
     app.dependency_overrides.clear()
 
 
-@pytest_asyncio.fixture
-async def user_a(db_session: AsyncSession) -> User:
-    """Create test user A."""
-    # Use a pre-hashed password to avoid bcrypt issues in tests
-    # This is "password123" hashed with bcrypt
-    user = User(
-        email="user_a@example.com",
-        name="User A",
-        hashed_password="$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewY5GyYqKvZ.KCqC",
+async def _create_user(engine, email: str, name: str) -> User:
+    """Insert a seed user once, committed outside any test transaction."""
+    session_maker = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
     )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-    return user
+    async with session_maker() as session:
+        user = User(
+            email=email,
+            name=name,
+            hashed_password=PASSWORD_HASH,
+        )
+        session.add(user)
+        await session.commit()
+        await session.refresh(user)
+        return user
 
 
-@pytest_asyncio.fixture
-async def user_b(db_session: AsyncSession) -> User:
-    """Create test user B."""
-    # Use a pre-hashed password to avoid bcrypt issues in tests
-    # This is "password123" hashed with bcrypt
-    user = User(
-        email="user_b@example.com",
-        name="User B",
-        hashed_password="$2b$12$LQv3c1yqBWVHxkd0LHAkCOYz6TtxMQJqhN8/LewY5GyYqKvZ.KCqC",
-    )
-    db_session.add(user)
-    await db_session.commit()
-    await db_session.refresh(user)
-    return user
+@pytest_asyncio.fixture(scope="session")
+async def user_a(engine) -> User:
+    """Create test user A once per session."""
+    return await _create_user(engine, "user_a@example.com", "User A")
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session")
+async def user_b(engine) -> User:
+    """Create test user B once per session."""
+    return await _create_user(engine, "user_b@example.com", "User B")
+
+
+@pytest.fixture(scope="session")
 def auth_headers_user_a(user_a: User) -> dict:
-    """Get auth headers for user A."""
+    """Get auth headers for user A, signing the JWT once per session."""
     token = create_access_token({"user_id": user_a.id})
     return {"Authorization": f"Bearer {token}"}
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def auth_headers_user_b(user_b: User) -> dict:
-    """Get auth headers for user B."""
+    """Get auth headers for user B, signing the JWT once per session."""
     token = create_access_token({"user_id": user_b.id})
     return {"Authorization": f"Bearer {token}"}
 
 
 @pytest_asyncio.fixture
-async def task_user_a(db_session: AsyncSession, user_a: User) -> Task:
-    """Create task for user A."""
-    task = Task(
-        user_id=user_a.id,
-        title="User A's Task",
-        description="This belongs to User A",
-        completed=False,
+async def seed_tasks(
+    db_session: AsyncSession, user_a: User, user_b: User
+) -> tuple[Task, Task]:
+    """Create both users' tasks with one add_all and a single commit.
+
+    No refresh is needed: ids are assigned at flush and expire_on_commit
+    is False, so the instances stay fully loaded.
+    """
+    # Task.user_id is a string column (Better-Auth ids); User.id is an int,
+    # so coerce here rather than relying on a refresh round-trip to do it
+    tasks = (
+        Task(
+            user_id=str(user_a.id),
+            title="User A's Task",
+            description="This belongs to User A",
+            completed=False,
+        ),
+        Task(
+            user_id=str(user_b.id),
+            title="User B's Task",
+            description="This belongs to User B",
+            completed=False,
+        ),
     )
-    db_session.add(task)
+    db_session.add_all(tasks)
     await db_session.commit()
-    await db_session.refresh(task)
-    return task
+    return tasks
 
 
-@pytest_asyncio.fixture
-async def task_user_b(db_session: AsyncSession, user_b: User) -> Task:
-    """Create task for user B."""
-    task = Task(
-        user_id=user_b.id,
-        title="User B's Task",
-        description="This belongs to User B",
-        completed=False,
-    )
-    db_session.add(task)
-    await db_session.commit()
-    await db_session.refresh(task)
-    return task
+@pytest.fixture
+def task_user_a(seed_tasks: tuple[Task, Task]) -> Task:
+    """Task for user A."""
+    return seed_tasks[0]
+
+
+@pytest.fixture
+def task_user_b(seed_tasks: tuple[Task, Task]) -> Task:
+    """Task for user B."""
+    return seed_tasks[1]